@@ -71,6 +71,10 @@ class Camera:
 
             self.default_settings = CameraSettings(self)
 
+        # read() fills these two buffers in turn instead of allocating a new frame every time
+        self._frames = [None, None]
+        self._next_frame = 0
+
     def reset(self):
         if self.is_axis_camera:
             # For Axis cameras, reset means opening the iris (bright mode)
@@ -208,8 +212,17 @@ class Camera:
             self.read()
 
     def read(self):
-        ret_val, image = self.device.read()
+        """
+        Grab the next frame.
+
+        The returned image is reused by the read after next, so copy it if it
+        has to outlive that.
+        """
+        index = self._next_frame
+        ret_val, image = self.device.read(self._frames[index])
         if not ret_val:
             raise Exception("Failed to read image")
 
+        self._frames[index] = image
+        self._next_frame = index ^ 1
         return image
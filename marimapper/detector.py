@@ -3,12 +3,14 @@ import logging
 import cv2
 import time
 from typing import Optional
+from queue import Full
 import numpy as np
 from multiprocessing import get_logger
 
 from marimapper.camera import Camera
 from marimapper.timeout_controller import TimeoutController
 from marimapper.led import Point2D, LED2D
+from marimapper.queues import FrameQueue
 
 
 logger = get_logger()
@@ -111,13 +113,20 @@ def draw_led_detections(image: cv2.Mat, led_detection: Optional[Point2D]) -> np.
     return render_image
 
 
+def offer_frame(frame_queue: FrameQueue, image: np.ndarray) -> None:
+    """Put image on frame_queue without blocking; the queue itself overwrites its oldest waiting frame."""
+    try:
+        frame_queue.put_nowait(image)
+    except Full:
+        pass  # the GUI is still copying out of the only slot, drop this frame
+    except ValueError as e:
+        logger.warning(f"Dropping frame: {e}")
+
+
 def show_image(image: np.ndarray, frame_queue=None) -> None:
     if frame_queue is not None:
         # GUI mode: Send frame to queue (non-blocking)
-        try:
-            frame_queue.put_nowait(image)
-        except:
-            pass  # Queue full, drop frame
+        offer_frame(frame_queue, image)
     else:
         # CLI mode: Show window
         cv2.imshow("MariMapper - Detector", image)
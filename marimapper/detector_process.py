@@ -1,8 +1,10 @@
 from multiprocessing import get_logger, Process, Queue, Event
 import time
 from enum import Enum
+from queue import Empty
 import numpy as np
 from marimapper.detector import (
+    offer_frame,
     show_image,
     set_cam_default,
     Camera,
@@ -115,14 +117,17 @@ def detect_leds(
     leds = []
     for led_id in range(led_id_from, led_id_to):
         # Check for cancellation commands in queue before processing each LED
-        if command_queue is not None and not command_queue.empty():
+        if command_queue is not None:
             try:
                 # Peek at commands and consume only CANCEL_SCAN
                 temp_commands = []
                 cancelled = False
 
-                while not command_queue.empty():
-                    cmd_data = command_queue.get_nowait()
+                while True:
+                    try:
+                        cmd_data = command_queue.get_nowait()
+                    except Empty:
+                        break
                     if isinstance(cmd_data, tuple):
                         command, _ = cmd_data
                     else:
@@ -142,8 +147,8 @@ def detect_leds(
 
                 if cancelled:
                     return None  # Signal cancellation
-            except:
-                pass
+            except Exception as e:
+                logger.warning(f"Failed to check for scan cancellation: {e}")
 
         # Also check cancel event flag
         if cancel_event is not None and cancel_event.is_set():
@@ -283,11 +288,16 @@ class DetectorProcess(Process):
 
         while not self._exit_event.is_set():
 
-            if not self._request_detections_queue.empty():
+            # One non-blocking get rather than empty() then get(): a single pipe poll, and no window
+            # between the check and the read
+            try:
+                request = self._request_detections_queue.get_nowait()
+            except Empty:
+                request = None
+
+            if request is not None:
 
-                led_id_from, led_id_to, view_id = (
-                    self._request_detections_queue.get_id_from_id_to_view()
-                )
+                led_id_from, led_id_to, view_id = request
 
                 # Clear any previous cancellation before starting new scan
                 self._cancel_scan_event.clear()
@@ -391,7 +401,7 @@ class DetectorProcess(Process):
                 # and lets reset everything back to normal
                 set_cam_default(cam)
 
-            if self._request_detections_queue.empty():
+            else:
                 idle_loop_count += 1
                 if idle_loop_count == 1:
                     logger.info(f"Entering idle loop. Display={self._display}, frame_queue={self._frame_queue is not None}")
@@ -406,24 +416,28 @@ class DetectorProcess(Process):
                     image = cam.read()
                     # Send frame to GUI if frame_queue is provided
                     if self._frame_queue is not None:
-                        # Use put_nowait to avoid blocking if queue is full (drop frames)
+                        # Never block on a slow GUI; a full queue loses its oldest frame instead
                         try:
-                            self._frame_queue.put_nowait(image)
+                            offer_frame(self._frame_queue, image)
                             frame_send_count += 1
                             if frame_send_count <= 3:  # Log first 3 frames
                                 logger.info(f"Sent frame {frame_send_count} to GUI queue. Shape: {image.shape}")
                         except Exception as e:
                             if frame_send_count == 0:  # Only log if we haven't sent any frames yet
                                 logger.warning(f"Failed to send frame to GUI queue: {e}")
-                            pass  # Queue full, drop frame
                     else:
                         # CLI mode: Show window
                         show_image(image)
                     time.sleep(1 / 60)
 
-                if self._render_backend_info and not self._input_3d_info_queue.empty():
-                    led_info: dict[int, LEDInfo] = self._input_3d_info_queue.get()
+                led_info = None
+                if self._render_backend_info:
+                    try:
+                        led_info: dict[int, LEDInfo] = self._input_3d_info_queue.get_nowait()
+                    except Empty:
+                        pass
 
+                if led_info is not None:
                     success = render_led_info(led_info, led_backend)
                     if not success:
                         logger.debug(
@@ -431,10 +445,13 @@ class DetectorProcess(Process):
                         )
 
                 # Handle camera control commands
-                if not self._camera_command_queue.empty():
-                    try:
-                        cmd_data = self._camera_command_queue.get_nowait()
+                try:
+                    cmd_data = self._camera_command_queue.get_nowait()
+                except Empty:
+                    cmd_data = None
 
+                if cmd_data is not None:
+                    try:
                         # Handle tuple (command, value) or just command
                         if isinstance(cmd_data, tuple):
                             command, value = cmd_data
@@ -527,10 +544,10 @@ class DetectorProcess(Process):
                             # Set the cancel flag
                             self._cancel_scan_event.set()
                             # Clear any pending scan requests from the queue
-                            while not self._request_detections_queue.empty():
+                            while True:
                                 try:
                                     self._request_detections_queue.get_nowait()
-                                except:
+                                except Empty:
                                     break
                             logger.info("Scan cancellation requested, pending requests cleared")
                     except Exception as e:
@@ -18,7 +18,7 @@ from typing import List, Optional
 import numpy as np
 
 from marimapper.camera import Camera
-from marimapper.detector import set_cam_dark, set_cam_default, find_led_in_image, draw_led_detections
+from marimapper.detector import set_cam_dark, set_cam_default, find_led_in_image, draw_led_detections, offer_frame
 from marimapper.led import LED2D, Point2D
 from marimapper.queues import Queue2D, DetectionControlEnum
 from marimapper.timeout_controller import TimeoutController
@@ -113,10 +113,7 @@ class DetectorWorkerProcess(Process):
 
             # Send to GUI frame queue if provided
             if self._frame_queue is not None:
-                try:
-                    self._frame_queue.put_nowait(rendered_image)
-                except queue.Full:
-                    pass  # Skip frame if queue full
+                offer_frame(self._frame_queue, rendered_image)
             else:
                 # Fallback to cv2.imshow for CLI
                 window_name = f"MariMapper - Camera {self.camera_id}"
@@ -171,10 +168,7 @@ class DetectorWorkerProcess(Process):
 
             if self._frame_queue is not None:
                 # Send to GUI frame queue
-                try:
-                    self._frame_queue.put_nowait(frame)
-                except queue.Full:
-                    pass  # Skip frame if queue full
+                offer_frame(self._frame_queue, frame)
             else:
                 # Fallback to cv2.imshow for CLI
                 if not self._window_initialized:
@@ -1,4 +1,6 @@
 from multiprocessing import Process, Event
+from multiprocessing.connection import wait
+from queue import Empty
 from marimapper.queues import Queue2D, Queue3D, DetectionControlEnum
 from marimapper.led import LED2D
 import time
@@ -34,21 +36,39 @@ class FileWriterProcess(Process):
     def run(self):
         views: dict[int, list[LED2D]] = {}
         view_id_to_filename: dict[int, Path] = {}
+        # Enum members unpickle to the same singletons, so they can be bound once and compared with "is"
+        DETECT = DetectionControlEnum.DETECT
+        DONE = DetectionControlEnum.DONE
+        DELETE = DetectionControlEnum.DELETE
+
+        readers = [self._input_queue_2d.reader(), self._input_queue_3d.reader()]
 
         while not self._exit_event.is_set():
 
-            if not self._input_queue_3d.empty():
-                leds = self._input_queue_3d.get()
+            # Block until either queue has something instead of spinning on them; the timeout only
+            # bounds how long stop() takes to be noticed
+            wait(readers, timeout=0.25)
+
+            try:
+                leds = self._input_queue_3d.get_nowait()
+            except Empty:
+                leds = None
+
+            if leds is not None:
                 write_3d_leds_to_file(leds, self._base_path / "led_map_3d.csv")
 
-            if not self._input_queue_2d.empty():
-                control, data = self._input_queue_2d.get()
+            try:
+                control, data = self._input_queue_2d.get_nowait()
+            except Empty:
+                control = None
+
+            if control is not None:
 
-                if control == DetectionControlEnum.DONE:
+                if control is DONE:
                     view_id = data
                     write_2d_leds_to_file(views[view_id], view_id_to_filename[view_id])
 
-                if control == DetectionControlEnum.DETECT:
+                if control is DETECT:
                     led = data
 
                     if led.view_id not in view_id_to_filename:
@@ -57,7 +77,7 @@ class FileWriterProcess(Process):
 
                     views[led.view_id].append(led)
 
-                if control == DetectionControlEnum.DELETE:
+                if control is DELETE:
                     view_id = data
                     del views[view_id]
                     del view_id_to_filename[view_id]
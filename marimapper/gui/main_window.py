@@ -5,7 +5,6 @@ This is the primary window that integrates all GUI components and manages
 the Scanner instance.
 """
 
-from multiprocessing import Queue
 from pathlib import Path
 import csv
 import cv2
@@ -24,6 +23,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSlot, QTimer, QThread, pyqtSignal
 
 from marimapper.scanner import Scanner
+from marimapper.queues import FrameQueue
 from marimapper.detector_process import CameraCommand
 from marimapper.gui.signals import MariMapperSignals
 from marimapper.file_tools import load_3d_leds_from_file
@@ -310,7 +310,7 @@ class MainWindow(QMainWindow):
         # Worker thread signals
         self.signals.frame_ready.connect(self.detector_widget.update_frame)
         self.signals.frame_ready_multi.connect(self.on_frame_ready_multi)
-        self.signals.log_message.connect(self.log_widget.add_message)
+        self.signals.log_batch.connect(self.log_widget.add_messages)
         self.signals.scan_completed.connect(self.on_scan_completed)
         self.signals.scan_failed.connect(self.on_scan_failed)
         self.signals.reconstruction_updated.connect(self.on_reconstruction_updated)
@@ -364,7 +364,7 @@ class MainWindow(QMainWindow):
             "status_visible": self.status_table.isVisible(),
         }
 
-        self.log_widget.setVisible(False)
+        self._set_log_visible(False)
         self.status_table.setVisible(False)
         self.transform_controls.setVisible(False)
         self.placement_panel.setVisible(True)
@@ -403,7 +403,7 @@ class MainWindow(QMainWindow):
                 return False
         self.placement_mode_active = False
 
-        self.log_widget.setVisible(self._pre_placement_layout.get("log_visible", True) if self._pre_placement_layout else True)
+        self._set_log_visible(self._pre_placement_layout.get("log_visible", True) if self._pre_placement_layout else True)
         self.status_table.setVisible(self._pre_placement_layout.get("status_visible", True) if self._pre_placement_layout else True)
         self.placement_panel.setVisible(False)
         self.transform_controls.setVisible(self.tab_widget.currentWidget() == self.visualizer_3d_widget)
@@ -743,7 +743,7 @@ class MainWindow(QMainWindow):
         self.log_widget.log_info("Initializing scanner...")
 
         # Create frame queue for receiving video frames
-        self.frame_queue = Queue(maxsize=3)  # Small queue to avoid backlog
+        self.frame_queue = FrameQueue()  # Frames travel through shared memory slots, not the pipe
 
         # Create and start initialization thread
         self.init_thread = ScannerInitThread(self.scanner_args, self.frame_queue)
@@ -801,6 +801,7 @@ class MainWindow(QMainWindow):
         self.monitor_thread = StatusMonitorThread(
             self.signals, frame_queues, detector_update_queue, info_3d_queue, data_3d_queue
         )
+        self.monitor_thread.set_log_enabled(self.log_widget.isVisibleTo(self))
         self.monitor_thread.start()
 
         self.log_widget.log_info("Monitor thread started, watching for 3D info updates...")
@@ -1106,16 +1107,22 @@ class MainWindow(QMainWindow):
         if maximize:
             # Hide the right panel and log widget
             self.right_widget.hide()
-            self.log_widget.hide()
+            self._set_log_visible(False)
             self.statusBar().showMessage("Video maximized (double-click or click button to restore)")
         else:
             # Restore all panels
             self.right_widget.show()
-            self.log_widget.show()
+            self._set_log_visible(True)
             # Restore splitter sizes
             self.main_splitter.setSizes(self.original_splitter_sizes)
             self.statusBar().showMessage("Video restored")
 
+    def _set_log_visible(self, visible: bool):
+        """Show or hide the log panel; the monitor thread only builds log lines while it can be seen."""
+        self.log_widget.setVisible(visible)
+        if self.monitor_thread is not None:
+            self.monitor_thread.set_log_enabled(self.log_widget.isVisibleTo(self))
+
     @pyqtSlot(int)
     def on_scan_completed(self, view_id: int):
         """
@@ -1874,5 +1881,8 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 self.log_widget.log_error(f"Error closing scanner: {str(e)}")
 
+        if self.frame_queue is not None:
+            self.frame_queue.close()
+
         self.log_widget.log_success("Shutdown complete")
         event.accept()
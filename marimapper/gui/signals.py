@@ -34,5 +34,5 @@ class MariMapperSignals(QObject):
     process_crashed = pyqtSignal(str)  # process name
     all_processes_healthy = pyqtSignal()
 
-    # Log message signal
-    log_message = pyqtSignal(str, str)  # (level, message) where level = info/warning/error
+    # Log signal
+    log_batch = pyqtSignal(list)  # [(level, message) or (level, template, args), ...] from one monitor wake
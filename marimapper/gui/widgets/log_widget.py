@@ -9,6 +9,14 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QPushButton
 from PyQt6.QtCore import pyqtSlot
 from PyQt6.QtGui import QTextCursor
 
+# Color mapping for different levels
+LEVEL_COLORS = {
+    "info": "black",
+    "warning": "orange",
+    "error": "red",
+    "success": "green",
+}
+
 
 class LogWidget(QWidget):
     """Widget for displaying log messages."""
@@ -54,26 +62,32 @@ class LogWidget(QWidget):
             level: Message level ('info', 'warning', 'error')
             message: The message text
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.add_messages([(level, message)])
+
+    @pyqtSlot(list)
+    def add_messages(self, messages: list):
+        """
+        Add several log messages at once, scrolling to the bottom only after the last.
 
-        # Color mapping for different levels
-        color_map = {
-            "info": "black",
-            "warning": "orange",
-            "error": "red",
-            "success": "green",
-        }
+        Args:
+            messages: (level, message) pairs, as taken by add_message, or
+                (level, template, args) triples that are %-formatted here
+        """
+        timestamp = datetime.now().strftime("%H:%M:%S")
 
-        color = color_map.get(level.lower(), "black")
+        for level, message, *args in messages:
+            if args and args[0]:
+                message = message % args[0]
+            color = LEVEL_COLORS.get(level.lower(), "black")
 
-        # Format the message with HTML for color
-        formatted_message = (
-            f'<span style="color: gray;">[{timestamp}]</span> '
-            f'<span style="color: {color};"><b>{level.upper()}:</b> {message}</span>'
-        )
+            # Format the message with HTML for color
+            formatted_message = (
+                f'<span style="color: gray;">[{timestamp}]</span> '
+                f'<span style="color: {color};"><b>{level.upper()}:</b> {message}</span>'
+            )
 
-        # Append to text edit
-        self.text_edit.append(formatted_message)
+            # Append to text edit
+            self.text_edit.append(formatted_message)
 
         # Auto-scroll to bottom
         cursor = self.text_edit.textCursor()
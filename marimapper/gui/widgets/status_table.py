@@ -316,8 +316,6 @@ class StatusTable(QWidget):
         Args:
             led_info_dict: Dictionary mapping LED ID (int) to LEDInfo (enum)
         """
-        print(f"StatusTable: update_led_info called with {len(led_info_dict)} LEDs")
-
         # Store the data
         self.led_data = led_info_dict
         self.sorted_ids = sorted(led_info_dict.keys())
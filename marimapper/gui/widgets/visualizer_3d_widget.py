@@ -4,11 +4,21 @@
 This version provides hover highlighting (bright pink) and click-to-toggle LEDs.
 """
 
+import math
 import numpy as np
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QVector4D, QFont
+from PyQt6.QtCore import Qt, QObject, QPointF, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from marimapper.led import LED3D
+from marimapper.gui.widgets.visualizer_kernels import (
+    build_screen_grid,
+    gated_segments,
+    grid_nearest,
+    nearest_screen_point,
+    point_segment_distances,
+    project_and_pick,
+    project_points,
+)
 
 IMPORT_ERROR_MSG = None
 try:
@@ -41,11 +51,126 @@ except Exception as e:
     GLTextItem = None
 
 
+# Clouds at least this large have transform updates computed on the global thread pool
+ASYNC_TRANSFORM_MIN_POINTS = 10000
+# Hover/click picks snap to the nearest LED within this many screen pixels
+PICK_RADIUS_PX = 30.0
+# Clouds at least this large get a screen-space grid so cached picks only test nearby points
+PICK_GRID_MIN_POINTS = 5000
+# Hover picking runs at most once per this many ms (~60 Hz), however fast the mouse moves
+HOVER_INTERVAL_MS = 16
+
+ACTIVE_COLOR = (1.0, 0.0, 1.0, 1.0)  # active pink
+HOVER_COLOR = (1.0, 0.2, 1.0, 1.0)  # hover highlight
+FALLBACK_RGB = (0.5, 0.5, 1.0)  # used when an LED cannot report its colour
+LINE_COLOR = (0.6, 0.6, 0.6, 0.3)  # one colour for every connecting segment
+
+# World (x, y-up, z-depth) -> GL view (x, -z, y); +Z in world goes away from the camera
+_WORLD_TO_VIEW = np.array([[1, 0, 0], [0, 0, -1], [0, 1, 0]], dtype=np.float32)
+
+
+def _transform_points(points: np.ndarray, rot_mat: np.ndarray, scale_vec: np.ndarray, translation) -> np.ndarray:
+    """Scale, rotate then translate an Nx3 array of world points."""
+    return (points * scale_vec) @ rot_mat.T + np.asarray(translation, dtype=points.dtype)
+
+
+def _world_to_view(points: np.ndarray) -> np.ndarray:
+    """Map Nx3 world coords (x, y-up, z-depth) into GL's z-up view space."""
+    return points @ _WORLD_TO_VIEW.T
+
+
+# Static scene geometry, mapped into view space once at import
+_FLOOR_LABELS = [
+    (text, tuple(float(c) for c in _world_to_view(np.array(world_pos, dtype=np.float32))))
+    for text, world_pos in [("N", (0, 0, 10)), ("S", (0, 0, -10)), ("E", (10, 0, 0)), ("W", (-10, 0, 0))]
+]
+# short ticks toward N/S/E/W, as start/end pairs
+_FLOOR_MARKS_VIEW = _world_to_view(
+    np.array(
+        [
+            [0, 0, 8], [0, 0, 9.5],
+            [0, 0, -8], [0, 0, -9.5],
+            [8, 0, 0], [9.5, 0, 0],
+            [-8, 0, 0], [-9.5, 0, 0],
+        ],
+        dtype=np.float32,
+    )
+)
+_FLOOR_MARKS_COLORS = np.tile(np.array([0.7, 0.7, 0.7, 0.6], dtype=np.float32), (len(_FLOOR_MARKS_VIEW), 1))
+_AXES_VIEW = _world_to_view(
+    np.array(
+        [
+            [0, 0, 0], [1.5, 0, 0],  # +X red
+            [0, 0, 0], [0, 1.5, 0],  # +Y green (up)
+            [0, 0, 0], [0, 0, 1.5],  # +Z blue (depth forward)
+        ],
+        dtype=np.float32,
+    )
+)
+_UNIT_AXES = np.eye(3)
+_GIZMO_COLORS = np.array(
+    [
+        [1.0, 0.2, 0.2, 1.0],
+        [1.0, 0.2, 0.2, 1.0],
+        [0.3, 1.0, 0.3, 1.0],
+        [0.3, 1.0, 0.3, 1.0],
+        [0.2, 0.5, 1.0, 1.0],
+        [0.2, 0.5, 1.0, 1.0],
+    ],
+    dtype=np.float32,
+)
+_AXES_COLORS = np.array(
+    [
+        [1.0, 0.1, 0.1, 1.0],
+        [1.0, 0.1, 0.1, 1.0],
+        [0.2, 1.0, 0.2, 1.0],
+        [0.2, 1.0, 0.2, 1.0],
+        [0.2, 0.4, 1.0, 1.0],
+        [0.2, 0.4, 1.0, 1.0],
+    ],
+    dtype=np.float32,
+)
+
+
+_ORIGIN_SPHERE_MD = None
+
+
+def _origin_sphere_meshdata():
+    """Origin marker mesh, built on first use and shared by every widget (GLMeshItem only reads it)."""
+    global _ORIGIN_SPHERE_MD
+    if _ORIGIN_SPHERE_MD is None:
+        _ORIGIN_SPHERE_MD = MeshData.sphere(rows=16, cols=32, radius=0.3)
+    return _ORIGIN_SPHERE_MD
+
+
+class _TransformSignals(QObject):
+    """Carries transform results from the thread pool back to the GUI thread."""
+
+    finished = pyqtSignal(int, object)  # (transform version, view-space positions)
+
+
+class _TransformTask(QRunnable):
+    """Transform a snapshot of working positions into view space off the GUI thread."""
+
+    def __init__(self, version: int, points: np.ndarray, view_mat: np.ndarray, view_trans: np.ndarray, signals):
+        super().__init__()
+        self.version = version
+        self.points = points
+        self.view_mat = view_mat
+        self.view_trans = view_trans
+        self.signals = signals
+
+    def run(self):
+        self.signals.finished.emit(self.version, self.points @ self.view_mat.T + self.view_trans)
+
+
 if PG_AVAILABLE:
     class UnclampedGLViewWidget(GLViewWidget):
         """Drop the default elevation clamp so we can orbit past +/-90°."""
 
         def orbit(self, azim, elev):
+            if not azim and not elev:
+                return  # nothing moved; don't schedule a repaint
             # Allow full rotation without the usual [-90, 90] elevation clamp.
             self.opts["azimuth"] = (self.opts.get("azimuth", 0) + azim) % 360
             self.opts["elevation"] = (self.opts.get("elevation", 0) + elev) % 360
@@ -75,22 +200,85 @@ class Visualizer3DWidget(QWidget):
         self.gizmo_enabled: bool = False
         self.gizmo_anchor: np.ndarray | None = None
         self.gizmo_axis_len: float = 1.5
+        self._gizmo_cache_key: tuple | None = None
         self.gizmo_selection_ids: set[int] = set()
         self.gizmo_selection_indices: list[int] = []
         self._gizmo_dragging: bool = False
         self._gizmo_active_axis: str | None = None
         self._gizmo_start_mouse: np.ndarray | None = None
         self._gizmo_start_positions: np.ndarray | None = None
+        # Camera matrices captured at gizmo press. Wheel and key input is ignored until release so the
+        # camera cannot move mid-drag; a resize recaptures them since it only changes the projection
+        self._gizmo_drag_mats: tuple | None = None
+        # Anchor then the x/y/z axis tips in working space, rewritten per gizmo event
+        self._gizmo_pts_buf = np.empty((4, 3))
         self.id_to_index: dict[int, int] = {}
         self.base_positions: np.ndarray | None = None
         self.working_positions: np.ndarray | None = None
         self.base_normals: np.ndarray | None = None
         self.working_normals: np.ndarray | None = None
+        # Per-LED ids and reconstruction errors, parallel to the position arrays
+        self._ids: np.ndarray | None = None
+        self._errors: np.ndarray | None = None
+        # Per-LED RGBA from LED info, and which rows are currently active
+        self._base_colors: np.ndarray | None = None
+        self._active_mask: np.ndarray | None = None
+        # True where the next LED in the list has the next id; only changes with the LED list
+        self._adj_mask: np.ndarray | None = None
+        # Over-allocated buffers behind per-LED arrays grown by add_placeholder_led
+        self._led_row_backing: dict[str, np.ndarray] = {}
+        # Bumped whenever working positions change; keys the connecting-segment cache
+        self._working_version: int = 0
+        self._segment_cache_key: tuple | None = None
+        self._segment_idx: np.ndarray = np.zeros(0, dtype=np.intp)
+        # Scatter colours are rebuilt in place here rather than reallocated on every hover
+        self._color_buf: np.ndarray | None = None
+        # View-space positions for the scatter, rewritten in place on each synchronous refresh
+        self._view_pos_buf: np.ndarray | None = None
         self.current_transform = {
             "translation": (0.0, 0.0, 0.0),
             "rotation": (0.0, 0.0, 0.0),  # degrees
             "scale": (1.0, 1.0, 1.0),
         }
+        # Rotation/scale/translation derived from current_transform, rebuilt only in set_transform
+        self._cached_rot_mat: np.ndarray | None = None
+        self._cached_scale_vec: np.ndarray | None = None
+        self._cached_trans_vec: np.ndarray | None = None
+        # Scale, rotation and the world->view remap folded into one affine map for display
+        self._cached_view_mat: np.ndarray | None = None
+        self._cached_view_trans: np.ndarray | None = None
+        # Default placement (no rotation, unit scale, no offset) lets transforms pass points straight through
+        self._transform_is_identity: bool = True
+        # World-unit point size derived from the scale; only re-sent to the scatter when it changes
+        self._point_size: float = 1.0
+        self._uploaded_point_size: float | None = None
+        self._transform_cache_key: tuple | None = None
+        self._update_transform_cache()
+        # Bumped on every refresh so stale thread-pool transform results are dropped
+        self._transform_version: int = 0
+        self._pending_transform_task: _TransformTask | None = None
+        self._transform_signals = _TransformSignals()
+        self._transform_signals.finished.connect(self._on_transform_computed)
+        # Coalesce bursts of mouse moves into one pick per frame
+        self._hover_pos: QPointF | None = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(HOVER_INTERVAL_MS)
+        self._hover_timer.timeout.connect(self._do_hover)
+        # Bursts of edits (gizmo drags, key-repeat nudges, transform spin boxes) share one refresh per event-loop pass
+        self._pending_positions_refresh = False
+        self._pending_colors_refresh = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_deferred_refresh)
+        # Screen-space projection of the cloud, reused by picks while (positions version, MVP, size) match
+        self._positions_version: int = 0
+        self._screen_cache_key: tuple | None = None
+        self._cached_screen: np.ndarray | None = None
+        self._screen_grid: tuple | None = None
+        # (min_x, min_y, max_x, max_y) of the cached projection; NaN if nothing projected
+        self._screen_bbox: np.ndarray | None = None
         self.init_ui()
 
     def init_ui(self):
@@ -143,6 +331,9 @@ class Visualizer3DWidget(QWidget):
         self.view.mousePressEvent = self._wrapped_mouse_press(self.view.mousePressEvent)
         self.view.mouseReleaseEvent = self._wrapped_mouse_release(self.view.mouseReleaseEvent)
         self.view.keyPressEvent = self._wrapped_key_press(self.view.keyPressEvent)
+        self.view.wheelEvent = self._wrapped_wheel(self.view.wheelEvent)
+        self.view.resizeEvent = self._wrapped_resize(self.view.resizeEvent)
+        self.view.leaveEvent = self._wrapped_leave(self.view.leaveEvent)
 
         self._add_floor()
         self._add_origin_marker()
@@ -175,12 +366,38 @@ class Visualizer3DWidget(QWidget):
                 self._gizmo_active_axis = None
                 self._gizmo_start_mouse = None
                 self._gizmo_start_positions = None
+                self._gizmo_drag_mats = None
+                return
+            return original_handler(ev)
+        return handler
+
+    def _wrapped_leave(self, original_handler):
+        def handler(ev):
+            self._cancel_hover()
+            return original_handler(ev)
+        return handler
+
+    def _wrapped_wheel(self, original_handler):
+        def handler(ev):
+            if self._gizmo_dragging:
+                ev.accept()  # no zooming while the drag uses the matrices captured at press
                 return
             return original_handler(ev)
         return handler
 
+    def _wrapped_resize(self, original_handler):
+        def handler(ev):
+            result = original_handler(ev)
+            if self._gizmo_dragging:
+                self._gizmo_drag_mats = self._get_mvp()
+            return result
+        return handler
+
     def _wrapped_key_press(self, original_handler):
         def handler(ev):
+            if self._gizmo_dragging:
+                ev.accept()  # H, arrows and page keys would move the camera mid-drag
+                return
             if ev.key() == Qt.Key.Key_H:
                 self._reset_home_view()
                 ev.accept()
@@ -207,12 +424,12 @@ class Visualizer3DWidget(QWidget):
         )
         self.view.update()
 
+    # base_positions/base_normals are filled alongside leds_3d (update_3d_data, add_placeholder_led),
+    # so these never need to walk the LED objects
     def _base_positions_array(self):
         if self.base_positions is not None:
             return self.base_positions
-        if not self.leds_3d:
-            return np.zeros((0, 3), dtype=float)
-        return np.array([led.point.position for led in self.leds_3d], dtype=float)
+        return np.zeros((0, 3), dtype=np.float32)
 
     def _working_positions_array(self):
         if self.working_positions is not None:
@@ -222,69 +439,80 @@ class Visualizer3DWidget(QWidget):
     def _base_normals_array(self):
         if self.base_normals is not None:
             return self.base_normals
-        if not self.leds_3d:
-            return np.zeros((0, 3), dtype=float)
-        return np.array([led.point.normal for led in self.leds_3d], dtype=float)
+        return np.zeros((0, 3), dtype=np.float32)
 
     def _working_normals_array(self):
         if self.working_normals is not None:
             return self.working_normals
         return self._base_normals_array()
 
-    def _positions_array(self):
-        """Current (transformed) positions for display/picking."""
-        return self._to_view_space(self._transformed_positions())
-
-    def _to_view_space(self, points: np.ndarray) -> np.ndarray:
-        """Map world coords (x, y-up, z-depth) into GL's z-up view space."""
-        if points is None or points.size == 0:
-            return np.zeros((0, 3), dtype=float)
-        pts = np.asarray(points, dtype=float)
-        # Support both single-point and Nx3 arrays
-        if pts.ndim == 1:
-            pts = pts.reshape(1, 3)
-        view_pts = pts[..., [0, 2, 1]]
-        view_pts[..., 1] *= -1.0  # flip depth so +Z in world goes away from camera
-        return view_pts.reshape(points.shape)
+    def _positions_array(self, out: np.ndarray | None = None):
+        """Current (transformed) positions for display/picking, optionally written into `out`."""
+        pts = self._working_positions_array()
+        if out is None:
+            return self._working_to_view(pts)
+        np.matmul(pts, self._cached_view_mat.T, out=out)
+        if not self._transform_is_identity:
+            out += self._cached_view_trans
+        return out
+
+    def _working_to_view(self, points: np.ndarray) -> np.ndarray:
+        """Apply the current transform and the world->view remap to Nx3 working-space points in one affine map."""
+        if self._transform_is_identity:
+            return _world_to_view(points)
+        return points @ self._cached_view_mat.T + self._cached_view_trans
+
+    @staticmethod
+    def _compute_base_colors(leds) -> np.ndarray:
+        """RGBA rows (0-1) for each LED's reconstruction state."""
+        colors = np.ones((len(leds), 4), dtype=np.float32)
+        rgb = colors[:, :3]
+        fallback = np.multiply(FALLBACK_RGB, 255.0)
+        for i, led in enumerate(leds):
+            # write the 0-255 triple straight into its row and normalise all rows once below
+            try:
+                rgb[i] = led.get_color()
+            except Exception:
+                rgb[i] = fallback
+        rgb /= 255.0
+        return colors
+
+    def _update_active_mask(self):
+        mask = np.zeros(len(self.leds_3d), dtype=bool)
+        idx = np.fromiter(
+            (self.id_to_index[led_id] for led_id in self.active_led_ids if led_id in self.id_to_index),
+            dtype=np.intp,
+        )
+        mask[idx] = True
+        self._active_mask = mask
 
     def _colors_array(self, highlight=None):
-        colors = []
-        for i, led in enumerate(self.leds_3d):
-            if led.led_id in self.active_led_ids:
-                base = np.array([1.0, 0.0, 1.0])  # active pink
-            else:
-                try:
-                    base = np.array(led.get_color()) / 255.0
-                except Exception:
-                    base = np.array([0.5, 0.5, 1.0])
-            if highlight is not None and i == highlight:
-                base = np.array([1.0, 0.2, 1.0])  # hover highlight
-            colors.append(np.r_[base, 1.0])  # RGBA
-        return np.array(colors, dtype=float) if colors else np.zeros((0, 4), dtype=float)
+        if self._base_colors is None or len(self._base_colors) == 0:
+            return np.zeros((0, 4), dtype=np.float32)
+        if self._color_buf is None or self._color_buf.shape != self._base_colors.shape:
+            self._color_buf = np.empty_like(self._base_colors)
+        colors = self._color_buf
+        np.copyto(colors, self._base_colors)
+        colors[self._active_mask] = ACTIVE_COLOR
+        if highlight is not None:
+            colors[highlight] = HOVER_COLOR
+        return colors
 
     def _apply_transform(self, points: np.ndarray) -> np.ndarray:
         """Apply current transform to point array (Nx3)."""
-        if points.size == 0:
+        if points.size == 0 or self._transform_is_identity:
             return points
 
-        rot_mat, scale_vec = self._rotation_matrix_and_scale()
-        scaled = points * scale_vec
-        rotated = scaled @ rot_mat.T
-
-        # Translation
-        tx, ty, tz = self.current_transform["translation"]
-        translated = rotated + np.array([tx, ty, tz])
-        return translated
+        return _transform_points(points, self._cached_rot_mat, self._cached_scale_vec, self._cached_trans_vec)
 
     def _transformed_positions(self) -> np.ndarray:
         return self._apply_transform(self._working_positions_array())
 
     def _transformed_normals(self) -> np.ndarray:
         normals = self._working_normals_array()
-        if normals.size == 0:
+        if normals.size == 0 or self._transform_is_identity:
             return normals
-        rot_mat, _ = self._rotation_matrix_and_scale()
-        return normals @ rot_mat.T
+        return normals @ self._cached_rot_mat.T
 
     def _point_size_from_scale(self) -> float:
         """Derive point size from average scale (clamped to a sensible range)."""
@@ -292,23 +520,79 @@ class Visualizer3DWidget(QWidget):
         avg_scale = max(0.01, (float(sx) + float(sy) + float(sz)) / 3.0)
         return max(0.2, min(5.0, 1.0 * avg_scale))
 
+    def _point_size_update(self) -> dict:
+        """setData kwargs carrying the point size, empty if the scatter already has it."""
+        if self._uploaded_point_size == self._point_size:
+            return {}
+        self._uploaded_point_size = self._point_size
+        return {"size": self._point_size}
+
+    def _request_refresh(self, positions: bool = True, colors: bool = False):
+        """Queue a positions and/or colours refresh for the next event-loop pass."""
+        self._pending_positions_refresh |= positions
+        self._pending_colors_refresh |= colors
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _do_deferred_refresh(self):
+        if self._pending_positions_refresh:
+            self._refresh_positions(with_colors=self._pending_colors_refresh)
+        elif self._pending_colors_refresh:
+            self._refresh_colors()
+
     def _refresh_view(self):
+        """Full refresh: positions, colours and connecting lines."""
+        self._refresh_positions(with_colors=True)
+
+    def _refresh_positions(self, with_colors: bool = False):
+        """Re-send scatter positions and rebuild the connecting lines; colours only if asked."""
         if not PG_AVAILABLE or self.leds_3d is None or len(self.leds_3d) == 0:
             return
 
-        pos = self._positions_array()
-        colors = self._colors_array(highlight=self.hover_index)
-        point_size = self._point_size_from_scale()
+        self._pending_positions_refresh = False
+        if with_colors:
+            self._pending_colors_refresh = False
+        # Any synchronous refresh supersedes transforms still running on the pool
+        self._transform_version += 1
+        self._invalidate_screen_cache()
+        count = len(self._working_positions_array())
+        if self._view_pos_buf is None or len(self._view_pos_buf) != count:
+            self._view_pos_buf = np.empty((count, 3), dtype=np.float32)
+        pos = self._positions_array(out=self._view_pos_buf)
 
         if self.scatter is None:
-            self.scatter = GLScatterPlotItem(pos=pos, color=colors, size=point_size, pxMode=False)
+            colors = self._colors_array(highlight=self.hover_index)
+            self.scatter = GLScatterPlotItem(pos=pos, color=colors, size=self._point_size, pxMode=False)
+            self._uploaded_point_size = self._point_size
             self.view.addItem(self.scatter)
         else:
-            self.scatter.setData(pos=pos, color=colors, size=point_size)
+            update = self._point_size_update()
+            if with_colors:
+                update["color"] = self._colors_array(highlight=self.hover_index)
+            self.scatter.setData(pos=pos, **update)
 
         # Draw sequential LED connections (optional aesthetic)
         self._update_lines(pos)
 
+    def _refresh_colors(self):
+        """Re-send only the scatter colours (active/hover changes leave positions untouched)."""
+        self._pending_colors_refresh = False
+        if self.scatter is None or not self.leds_3d:
+            return
+        self.scatter.setData(color=self._colors_array(highlight=self.hover_index))
+
+    def _patch_hover_color(self, previous: int | None):
+        """Move the hover highlight by rewriting only the two affected rows of the colour buffer."""
+        buf = self._color_buf
+        if buf is None or self._base_colors is None or buf.shape != self._base_colors.shape:
+            self._refresh_colors()
+            return
+        if previous is not None and previous < len(buf):
+            buf[previous] = ACTIVE_COLOR if self._active_mask[previous] else self._base_colors[previous]
+        if self.hover_index is not None:
+            buf[self.hover_index] = HOVER_COLOR
+        self.scatter.setData(color=buf)
+
     def _add_floor(self):
         """Add a simple floor grid and cardinal labels around the origin."""
         if not PG_AVAILABLE or GLGridItem is None:
@@ -326,42 +610,25 @@ class Visualizer3DWidget(QWidget):
         if GLTextItem is None:
             return  # text labels unavailable on this pyqtgraph version
 
-        labels = []
-        for text, world_pos in [
-            ("N", (0, 0, 10)),
-            ("S", (0, 0, -10)),
-            ("E", (10, 0, 0)),
-            ("W", (-10, 0, 0)),
-        ]:
-            gl_pos = tuple(self._to_view_space(np.array(world_pos, dtype=float)))
-            labels.append((text, gl_pos))
         font = QFont()
         font.setPointSize(14)
-        for text, pos in labels:
+        for text, pos in _FLOOR_LABELS:
             item = GLTextItem(text=text, color=(0.8, 0.8, 0.8, 0.9), font=font, pos=pos)
             self.view.addItem(item)
             self.floor_labels.append(item)
 
         # Add subtle floor direction marks (short ticks toward N/E/S/W)
-        mark_len = 1.5
-        marks_world = []
-        directions = [(0, 8, 0, mark_len), (0, -8, 0, -mark_len), (8, 0, mark_len, 0), (-8, 0, -mark_len, 0)]
-        for dx, dz, ox, oz in directions:
-            start = np.array([dx, 0.0, dz], dtype=float)
-            end = np.array([dx + ox, 0.0, dz + oz], dtype=float)
-            marks_world.extend([start, end])
-        marks_view = self._to_view_space(np.array(marks_world, dtype=float))
-        colors = np.array([[0.7, 0.7, 0.7, 0.6]] * len(marks_world), dtype=float)
-        self.floor_marks = GLLinePlotItem(pos=marks_view, color=colors, width=2, antialias=True, mode='lines')
+        self.floor_marks = GLLinePlotItem(
+            pos=_FLOOR_MARKS_VIEW, color=_FLOOR_MARKS_COLORS, width=2, antialias=True, mode='lines'
+        )
         self.view.addItem(self.floor_marks)
 
     def _add_origin_marker(self):
         """Add a small sphere at the origin to mark (0,0,0)."""
         if not PG_AVAILABLE or GLMeshItem is None or MeshData is None:
             return
-        sphere_md = MeshData.sphere(rows=16, cols=32, radius=0.3)
         sphere = GLMeshItem(
-            meshdata=sphere_md,
+            meshdata=_origin_sphere_meshdata(),
             smooth=True,
             color=(1.0, 0.85, 0.2, 1.0),  # warm yellow to differentiate
             shader="shaded",
@@ -374,28 +641,7 @@ class Visualizer3DWidget(QWidget):
         """Add small RGB axis lines at the origin to show orientation."""
         if not PG_AVAILABLE:
             return
-        axis_len = 1.5
-        axes_world = np.array(
-            [
-                [0, 0, 0], [axis_len, 0, 0],  # +X red
-                [0, 0, 0], [0, axis_len, 0],  # +Y green (up)
-                [0, 0, 0], [0, 0, axis_len],  # +Z blue (depth forward)
-            ],
-            dtype=float,
-        )
-        axes_view = self._to_view_space(axes_world)
-        colors = np.array(
-            [
-                [1.0, 0.1, 0.1, 1.0],
-                [1.0, 0.1, 0.1, 1.0],
-                [0.2, 1.0, 0.2, 1.0],
-                [0.2, 1.0, 0.2, 1.0],
-                [0.2, 0.4, 1.0, 1.0],
-                [0.2, 0.4, 1.0, 1.0],
-            ],
-            dtype=float,
-        )
-        gizmo = GLLinePlotItem(pos=axes_view, color=colors, width=3, antialias=True, mode='lines')
+        gizmo = GLLinePlotItem(pos=_AXES_VIEW, color=_AXES_COLORS, width=3, antialias=True, mode='lines')
         gizmo.translate(0, 0, 0)
         self.view.addItem(gizmo)
         self.axis_gizmo = gizmo
@@ -407,11 +653,26 @@ class Visualizer3DWidget(QWidget):
 
         self.leds_3d = leds_3d
         self.hover_index = None
-        self.base_positions = np.array([led.point.position for led in leds_3d], dtype=float)
-        self.base_normals = np.array([led.point.normal for led in leds_3d], dtype=float)
+        self._led_row_backing.clear()
+        # Gather LED fields in one pass into parallel arrays; positions/normals are float32 (what GL consumes)
+        count = len(leds_3d)
+        self._ids = np.empty(count, dtype=np.int32)
+        self._errors = np.empty(count, dtype=np.float32)
+        self.base_positions = np.empty((count, 3), dtype=np.float32)
+        self.base_normals = np.empty((count, 3), dtype=np.float32)
+        for i, led in enumerate(leds_3d):
+            point = led.point
+            self._ids[i] = led.led_id
+            self._errors[i] = getattr(point, "error", 0.0)
+            self.base_positions[i] = point.position
+            self.base_normals[i] = point.normal
         self.id_to_index = {led.led_id: i for i, led in enumerate(leds_3d)}
+        self._adj_mask = np.diff(self._ids) == 1
+        self._base_colors = self._compute_base_colors(leds_3d)
+        self._update_active_mask()
         # Working copies to support placement mode edits without losing originals
         self.working_positions = np.array(self.base_positions, copy=True)
+        self._working_version += 1
         self.working_normals = np.array(self.base_normals, copy=True)
 
         self._refresh_view()
@@ -421,53 +682,84 @@ class Visualizer3DWidget(QWidget):
         if not PG_AVAILABLE or not self.leds_3d:
             return
 
-        segments = []
-        colors = []
         pos = positions if positions is not None else self._positions_array()
-        for i in range(len(self.leds_3d) - 1):
-            cur = self.leds_3d[i]
-            nxt = self.leds_3d[i + 1]
-            if nxt.led_id - cur.led_id == 1:
-                # simple distance gating
-                dist = np.linalg.norm(pos[i] - pos[i + 1])
-                # compute local average distance on first handful
-                sample = min(10, len(pos) - 1)
-                avg = np.mean([np.linalg.norm(pos[j] - pos[j + 1]) for j in range(sample)])
-                if dist < avg * 1.5:
-                    segments.append(pos[i])
-                    segments.append(pos[i + 1])
-                    colors.append([0.6, 0.6, 0.6, 0.3])
-                    colors.append([0.6, 0.6, 0.6, 0.3])
-
-        if not segments:
+        if len(pos) < 2:
             return
 
-        seg_arr = np.array(segments, dtype=float)
-        color_arr = np.array(colors, dtype=float)
+        if len(pos) != len(self._working_positions_array()):
+            return
+        segment_idx = self._segment_indices()
+        if segment_idx.size == 0:
+            # nothing passes the gating any more; hide rather than leave the previous segments drawn
+            if self.lines is not None:
+                self.lines.setVisible(False)
+            return
+        seg_arr = pos[segment_idx]
 
         if self.lines is None:
             self.lines = GLLinePlotItem(
                 pos=seg_arr,
-                color=color_arr,
+                color=LINE_COLOR,
                 width=1,
                 antialias=True,
                 mode='lines',
             )
             self.view.addItem(self.lines)
         else:
-            self.lines.setData(pos=seg_arr, color=color_arr)
+            self.lines.setData(pos=seg_arr)
+            self.lines.setVisible(True)
+
+    def _segment_indices(self) -> np.ndarray:
+        """Interleaved (start, end) point indices of the connecting segments to draw.
+
+        Rotation and translation don't change which segments pass the gating, so
+        this is only recomputed when working positions or the scale change.
+        """
+        key = (self._working_version, tuple(self._cached_scale_vec.tolist()))
+        if key == self._segment_cache_key:
+            return self._segment_idx
+        pts = self._working_positions_array()
+        if len(pts) < 2:
+            idx = np.zeros(0, dtype=np.intp)
+        else:
+            # simple distance gating against the average spacing of the first handful of LEDs
+            idx = gated_segments(pts, self._cached_scale_vec, self._adj_mask)
+        self._segment_idx = idx
+        self._segment_cache_key = key
+        return idx
 
     def _handle_hover(self, ev):
-        """Find nearest point in screen space and highlight it."""
+        """Queue a hover pick at the latest mouse position."""
         if not PG_AVAILABLE or self.scatter is None or not self.leds_3d:
             return
         if self._gizmo_dragging:
             return
 
-        idx = self._pick_index(ev, verbose=False)
+        # Copy the position; the event itself is not valid once this handler returns
+        self._hover_pos = QPointF(ev.position())
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
+
+    def _cancel_hover(self):
+        """Drop any queued hover pick and clear the highlight once the cursor leaves the view."""
+        self._hover_timer.stop()
+        self._hover_pos = None
+        if self.hover_index is not None:
+            previous = self.hover_index
+            self.hover_index = None
+            if self.scatter is not None:
+                self._patch_hover_color(previous)
+
+    def _do_hover(self):
+        """Find nearest point in screen space and highlight it."""
+        if self._hover_pos is None or self.scatter is None or not self.leds_3d or self._gizmo_dragging:
+            return
+
+        idx = self._pick_index_at(self._hover_pos, verbose=False)
         if idx != self.hover_index:
+            previous = self.hover_index
             self.hover_index = idx
-            self.scatter.setData(color=self._colors_array(highlight=self.hover_index))
+            self._patch_hover_color(previous)
 
     def _handle_click(self, ev):
         """Emit led_clicked when a point is clicked."""
@@ -475,70 +767,72 @@ class Visualizer3DWidget(QWidget):
             return
 
         idx = self._pick_index(ev, verbose=True)
-        if idx is not None and 0 <= idx < len(self.leds_3d):
-            led_id = self.leds_3d[idx].led_id
-            self.led_clicked.emit(led_id)
+        if idx is not None and 0 <= idx < len(self._ids):
+            self.led_clicked.emit(int(self._ids[idx]))
 
     def _pick_index(self, ev, verbose=False):
+        """Screen-space nearest-neighbor picking for a mouse event."""
+        return self._pick_index_at(ev.position(), verbose=verbose)
+
+    def _invalidate_screen_cache(self):
+        """Mark displayed positions as changed so the next pick re-projects."""
+        self._positions_version += 1
+
+    def _pick_index_at(self, position: QPointF, verbose=False):
         """Screen-space nearest-neighbor picking using Qt matrices."""
         if not PG_AVAILABLE or not self.leds_3d:
             return None
 
-        pts = self._positions_array()
-        if len(pts) == 0:
-            return None
-
-        try:
-            viewport = self.view.getViewport()
-            proj = self.view.projectionMatrix(viewport, viewport)
-            view = self.view.viewMatrix()
-            mvp = proj * view
-        except Exception as e:
+        mats = self._get_mvp()
+        if mats is None:
             if verbose:
-                print(f"Visualizer3DWidget: pick failed, matrix error {e}")
+                print("Visualizer3DWidget: pick failed, camera matrices unavailable")
             return None
-
+        mvp, width, height = mats
         dpr = float(self.view.devicePixelRatioF())
-        width = max(1.0, self.view.width() * dpr)
-        height = max(1.0, self.view.height() * dpr)
 
-        screen_pts = np.full((len(pts), 2), np.nan, dtype=float)
-        valid = np.zeros(len(pts), dtype=bool)
-
-        for i, p in enumerate(pts):
-            v = mvp * QVector4D(float(p[0]), float(p[1]), float(p[2]), 1.0)
-            w = v.w()
-            if w == 0:
-                continue
-            x_ndc = v.x() / w
-            y_ndc = v.y() / w
-            screen_pts[i, 0] = (x_ndc + 1.0) * 0.5 * width
-            screen_pts[i, 1] = (1.0 - y_ndc) * 0.5 * height
-            valid[i] = True
-
-        if not valid.any():
-            if verbose:
-                print("Visualizer3DWidget: pick failed, no valid projected points")
+        mx = position.x() * dpr
+        my = position.y() * dpr
+        # Keying on the matrix itself catches every camera change (orbit, pan, zoom, home view, resize)
+        key = (self._positions_version, mvp.tobytes(), width, height)
+        if key != self._screen_cache_key:
+            pts = self._positions_array()
+            if len(pts) == 0:
+                return None
+
+            # Project and find the nearest point in one pass, keeping the projection for later picks
+            screen_pts = np.empty((len(pts), 2), dtype=np.float32)
+            nearest, min_dist2 = project_and_pick(pts, mvp.astype(np.float32), width, height, mx, my, screen_pts)
+
+            self._cached_screen = screen_pts
+            self._screen_cache_key = key
+            # fmin/fmax skip the NaN rows of points that did not project
+            self._screen_bbox = np.concatenate([np.fmin.reduce(screen_pts, axis=0), np.fmax.reduce(screen_pts, axis=0)])
+            self._screen_grid = None
+            if len(pts) >= PICK_GRID_MIN_POINTS:
+                self._screen_grid = build_screen_grid(screen_pts, width, height, PICK_RADIUS_PX)
+        elif not (
+            self._screen_bbox[0] - PICK_RADIUS_PX <= mx <= self._screen_bbox[2] + PICK_RADIUS_PX
+            and self._screen_bbox[1] - PICK_RADIUS_PX <= my <= self._screen_bbox[3] + PICK_RADIUS_PX
+        ):
+            # cursor is out of reach of the whole cloud (also true when the bbox is NaN)
             return None
+        elif self._screen_grid is not None:
+            nearest, min_dist2 = grid_nearest(self._cached_screen, self._screen_grid, mx, my, PICK_RADIUS_PX)
+        else:
+            nearest, min_dist2 = nearest_screen_point(self._cached_screen, mx, my)
 
-        mouse = np.array([ev.position().x() * dpr, ev.position().y() * dpr])
-        diffs = screen_pts - mouse
-        dists = np.linalg.norm(diffs, axis=1)
-        dists[~valid] = np.inf
-
-        if not np.isfinite(dists).any():
+        if nearest < 0:
             if verbose:
-                print("Visualizer3DWidget: pick failed, no finite distances")
+                print("Visualizer3DWidget: pick failed, no projected points near the cursor")
             return None
 
-        nearest = int(np.argmin(dists))
-        min_dist = dists[nearest]
         if verbose:
-            print(f"Visualizer3DWidget: pick min_dist_px={min_dist:.2f} idx={nearest} mouse={mouse}")
-        if min_dist < 30.0:  # pixel radius
-            return nearest
+            print(f"Visualizer3DWidget: pick min_dist_px={np.sqrt(min_dist2):.2f} idx={nearest} mouse={(mx, my)}")
+        if min_dist2 < PICK_RADIUS_PX * PICK_RADIUS_PX:
+            return int(nearest)
         if verbose:
-            print(f"Visualizer3DWidget: pick ignored, min_dist_px {min_dist:.2f} > 30")
+            print(f"Visualizer3DWidget: pick ignored, min_dist_px {np.sqrt(min_dist2):.2f} > {PICK_RADIUS_PX:g}")
         return None
 
     @pyqtSlot(object)
@@ -547,10 +841,17 @@ class Visualizer3DWidget(QWidget):
         if not PG_AVAILABLE:
             return
         try:
-            self.active_led_ids = set(led_ids)
+            active = set(led_ids)
         except Exception:
-            self.active_led_ids = set()
-        self._refresh_view()
+            active = set()
+        if active == self.active_led_ids and self.scatter is not None:
+            return  # selection handlers re-send the same set; the cached colours are still right
+        self.active_led_ids = active
+        self._update_active_mask()
+        if self.scatter is None:
+            self._refresh_view()
+        else:
+            self._request_refresh(positions=False, colors=True)
 
     @pyqtSlot(dict)
     def set_transform(
@@ -576,15 +877,52 @@ class Visualizer3DWidget(QWidget):
             if scale is not None:
                 transform["scale"] = scale
         self.current_transform = transform
-        self._refresh_view()
+        self._update_transform_cache()
+        if self.scatter is not None and len(self._working_positions_array()) >= ASYNC_TRANSFORM_MIN_POINTS:
+            self._schedule_transform()
+        else:
+            self._request_refresh()
+
+    def _schedule_transform(self):
+        """Compute transformed positions on the global thread pool, newest request wins."""
+        self._transform_version += 1
+        pool = QThreadPool.globalInstance()
+        if self._pending_transform_task is not None:
+            # Drop the previous request if it has not started yet; running ones are discarded by version
+            try:
+                pool.tryTake(self._pending_transform_task)
+            except RuntimeError:
+                pass  # already finished and deleted by the pool
+
+        # The working buffer is edited in place, so the task gets a copy it can read without racing those edits
+        task = _TransformTask(
+            self._transform_version,
+            self._working_positions_array().copy(),
+            self._cached_view_mat,
+            self._cached_view_trans,
+            self._transform_signals,
+        )
+        self._pending_transform_task = task
+        pool.start(task)
+
+    @pyqtSlot(int, object)
+    def _on_transform_computed(self, version: int, pos: np.ndarray):
+        """Upload thread-pool transform results on the GUI thread."""
+        if version != self._transform_version or self.scatter is None:
+            return
+        self._pending_transform_task = None
+        self._invalidate_screen_cache()
+        self.scatter.setData(pos=pos, **self._point_size_update())
+        self._update_lines(pos)
 
     def set_working_positions(self, positions: np.ndarray | None):
         """Set working positions (world space) used for display/exports."""
         if positions is None:
             self.working_positions = None
+            self._working_version += 1
         else:
-            self.working_positions = np.array(positions, dtype=float, copy=True)
-        self._refresh_view()
+            self._store_working_positions(positions)
+        self._request_refresh()
         self._update_gizmo_geometry()
         try:
             self.working_positions_changed.emit()
@@ -595,45 +933,59 @@ class Visualizer3DWidget(QWidget):
         """Restore working positions from base/original positions."""
         if self.base_positions is None:
             return
-        self.working_positions = np.array(self.base_positions, copy=True)
-        self._refresh_view()
+        self._store_working_positions(self.base_positions)
+        self._request_refresh()
         self._update_gizmo_geometry()
 
+    def _store_working_positions(self, positions: np.ndarray):
+        """Copy positions into the working buffer, reusing it when the LED count is unchanged."""
+        self._working_version += 1
+        if self.working_positions is not None and self.working_positions.shape == np.shape(positions):
+            np.copyto(self.working_positions, positions)
+        else:
+            self.working_positions = np.array(positions, dtype=np.float32, copy=True)
+
     def nudge_working_leds(self, led_ids: set[int], delta: tuple[float, float, float]) -> bool:
         """Nudge selected LEDs in working buffer by delta (world space)."""
         if self.working_positions is None or not led_ids:
             return False
-        moved = False
-        positions = np.array(self.working_positions, copy=True)
-        for led_id in led_ids:
-            idx = self.id_to_index.get(led_id)
-            if idx is None or idx >= len(positions):
-                continue
-            positions[idx] = positions[idx] + np.array(delta, dtype=float)
-            moved = True
-        if moved:
-            self.set_working_positions(positions)
-        return moved
+        count = len(self.working_positions)
+        idx = np.fromiter(
+            (i for i in (self.id_to_index.get(led_id) for led_id in led_ids) if i is not None and i < count),
+            dtype=np.intp,
+        )
+        if idx.size == 0:
+            return False
+        # Edit the working buffer in place; exports and the async transform task read their own copies
+        self.working_positions[idx] += np.asarray(delta, dtype=self.working_positions.dtype)
+        self._working_version += 1
+        self._request_refresh()
+        self._update_gizmo_geometry()
+        try:
+            self.working_positions_changed.emit()
+        except Exception:
+            pass
+        return True
 
     def export_transformed_leds(self):
         """Return transformed led data arrays (ids, positions, normals, errors) or None."""
         if not self.leds_3d or self.base_positions is None:
             return None
-        ids = [led.led_id for led in self.leds_3d]
         positions = self._transformed_positions()
         normals = self._transformed_normals()
-        errors = np.array([getattr(led.point, "error", 0.0) for led in self.leds_3d], dtype=float)
-        return ids, positions, normals, errors
+        if self._transform_is_identity:
+            # identity transforms hand back the working buffers themselves
+            positions = positions.copy()
+            normals = normals.copy()
+        return self._ids.tolist(), positions, normals, self._errors.copy()
 
     def export_working_leds(self):
         """Return working (un-transformed) led data arrays."""
         if not self.leds_3d or self.working_positions is None:
             return None
-        ids = [led.led_id for led in self.leds_3d]
         positions = np.array(self.working_positions, copy=True)
         normals = np.array(self.working_normals if self.working_normals is not None else self.base_normals, copy=True)
-        errors = np.array([getattr(led.point, "error", 0.0) for led in self.leds_3d], dtype=float)
-        return ids, positions, normals, errors
+        return self._ids.tolist(), positions, normals, self._errors.copy()
 
     def add_placeholder_led(self, led_id: int, position: np.ndarray) -> bool:
         """Append a synthetic LED (for problem placement) without resetting edits."""
@@ -648,23 +1000,52 @@ class Visualizer3DWidget(QWidget):
             led.point.error = 0.0
             self.leds_3d.append(led)
             self.id_to_index[led_id] = len(self.leds_3d) - 1
-            self.base_positions = np.vstack([self.base_positions, led.point.position])
-            self.working_positions = np.vstack([self.working_positions, led.point.position])
-            self.base_normals = np.vstack([self.base_normals, led.point.normal]) if self.base_normals is not None else np.array([led.point.normal])
-            self.working_normals = np.vstack([self.working_normals, led.point.normal]) if self.working_normals is not None else np.array([led.point.normal])
-            self._refresh_view()
+            position = np.asarray(led.point.position, dtype=np.float32)
+            normal = np.asarray(led.point.normal, dtype=np.float32)
+            self._append_led_row("base_positions", position)
+            self._append_led_row("working_positions", position)
+            self._working_version += 1
+            self._append_led_row("base_normals", normal)
+            self._append_led_row("working_normals", normal)
+            self._append_led_row("_ids", led_id)
+            self._append_led_row("_errors", led.point.error)
+            self._append_led_row("_base_colors", self._compute_base_colors([led])[0])
+            self._append_led_row("_active_mask", led_id in self.active_led_ids)
+            if len(self._ids) > 1:
+                self._append_led_row("_adj_mask", self._ids[-1] - self._ids[-2] == 1)
+            # Placement can add many placeholders in a row; draw them all in one refresh
+            self._request_refresh(colors=True)
             self._update_gizmo_anchor()
             self._update_gizmo_geometry()
             return True
         except Exception:
             return False
 
+    def _append_led_row(self, name: str, value):
+        """Append one row to a per-LED array attribute with amortised O(1) growth.
+
+        The attribute is a view onto a larger backing buffer that doubles when
+        full, so repeated placeholder appends don't copy every array each time.
+        """
+        current = getattr(self, name)
+        if current is None:
+            return
+        count = len(current)
+        backing = self._led_row_backing.get(name)
+        if backing is None or current.base is not backing or len(backing) <= count:
+            backing = np.empty((max(2 * count, 64),) + current.shape[1:], dtype=current.dtype)
+            backing[:count] = current
+            self._led_row_backing[name] = backing
+        backing[count] = value
+        setattr(self, name, backing[:count + 1])
+
     def set_gizmo_enabled(self, enabled: bool):
         """Toggle gizmo rendering/interaction (placement mode)."""
         self.gizmo_enabled = enabled
         if not enabled:
             self._gizmo_dragging = False
             self._gizmo_active_axis = None
+            self._gizmo_drag_mats = None
             self.gizmo_selection_ids = set()
             self.gizmo_selection_indices = []
             self._remove_gizmo()
@@ -704,7 +1085,11 @@ class Visualizer3DWidget(QWidget):
         self.gizmo_axis_len = max(0.4, (dist * 0.1) / avg_scale)
         a = self.gizmo_anchor
         axis_len = self.gizmo_axis_len
-        # Build in working space, then apply current transform before mapping to view
+        key = (tuple(float(v) for v in a), axis_len, self._transform_cache_key)
+        if self.gizmo_item is not None and key == self._gizmo_cache_key:
+            return  # same anchor, length and transform as what is already drawn
+        self._gizmo_cache_key = key
+        # Build in working space; one affine map applies the transform and the view remap
         axes_world = np.array(
             [
                 a, a + np.array([axis_len, 0, 0]),  # X
@@ -713,32 +1098,22 @@ class Visualizer3DWidget(QWidget):
             ],
             dtype=float,
         )
-        axes_world = self._apply_transform(axes_world)
-        axes_view = self._to_view_space(axes_world)
-        colors = np.array(
-            [
-                [1.0, 0.2, 0.2, 1.0],
-                [1.0, 0.2, 0.2, 1.0],
-                [0.3, 1.0, 0.3, 1.0],
-                [0.3, 1.0, 0.3, 1.0],
-                [0.2, 0.5, 1.0, 1.0],
-                [0.2, 0.5, 1.0, 1.0],
-            ],
-            dtype=float,
-        )
+        axes_view = self._working_to_view(axes_world)
         if self.gizmo_item is None:
-            self.gizmo_item = GLLinePlotItem(pos=axes_view, color=colors, width=6, antialias=True, mode='lines')
+            self.gizmo_item = GLLinePlotItem(pos=axes_view, color=_GIZMO_COLORS, width=6, antialias=True, mode='lines')
             self.view.addItem(self.gizmo_item)
         else:
-            self.gizmo_item.setData(pos=axes_view, color=colors)
+            self.gizmo_item.setData(pos=axes_view)
 
     def _gizmo_enabled_and_ready(self) -> bool:
         return self.gizmo_enabled and self.gizmo_anchor is not None and bool(self.gizmo_selection_indices)
 
     def _handle_gizmo_press(self, ev):
-        pick = self._pick_gizmo_axis(ev)
+        mats = self._get_mvp()
+        pick = self._pick_gizmo_axis(ev, mats)
         if pick is None:
             return False
+        self._gizmo_drag_mats = mats
         self._gizmo_dragging = True
         self._gizmo_active_axis = pick
         self._gizmo_start_mouse = self._event_mouse_pos(ev)
@@ -764,67 +1139,42 @@ class Visualizer3DWidget(QWidget):
         dpr = float(self.view.devicePixelRatioF())
         return np.array([ev.position().x() * dpr, ev.position().y() * dpr], dtype=float)
 
-    def _pick_gizmo_axis(self, ev) -> str | None:
-        mats = self._get_mvp()
+    def _pick_gizmo_axis(self, ev, mats=None) -> str | None:
+        if mats is None:
+            mats = self._get_mvp()
         if mats is None or self.gizmo_anchor is None:
             return None
-        viewport, mvp, width, height, dpr = mats
-        anchor_world = self._apply_transform(self.gizmo_anchor.reshape(1, 3))[0]
-        axis_len = self.gizmo_axis_len
-        axes = {
-            "x": np.array([axis_len, 0, 0], dtype=float),
-            "y": np.array([0, axis_len, 0], dtype=float),
-            "z": np.array([0, 0, axis_len], dtype=float),
-        }
-        mouse = self._event_mouse_pos(ev)
-        best_axis = None
-        best_dist = 1e9
-        for axis_name, vec in axes.items():
-            p0 = anchor_world
-            p1 = self._apply_transform(np.array([self.gizmo_anchor + vec], dtype=float))[0]
-            pts = self._to_view_space(np.vstack([p0, p1]))
-            screen = self._project_points_to_screen(pts, viewport, mvp, width, height, dpr)
-            if screen.shape[0] < 2 or np.any(~np.isfinite(screen)):
-                continue
-            a, b = screen[0], screen[1]
-            seg = b - a
-            seg_len = np.linalg.norm(seg)
-            if seg_len < 1e-3:
-                continue
-            t = np.clip(np.dot(mouse - a, seg) / (seg_len ** 2), 0.0, 1.0)
-            proj = a + t * seg
-            dist = np.linalg.norm(mouse - proj)
-            if dist < best_dist:
-                best_dist = dist
-                best_axis = axis_name
-        if best_dist < 40.0:
-            return best_axis
+        mvp, width, height = mats
+        # Anchor plus the three axis tips, transformed and projected together
+        pts = self._working_to_view(self._gizmo_points())
+        screen = self._project_points_to_screen(pts, mvp, width, height)
+        dists = point_segment_distances(self._event_mouse_pos(ev), np.repeat(screen[:1], 3, axis=0), screen[1:])
+        best = int(np.argmin(dists))
+        if dists[best] < 40.0:
+            return "xyz"[best]
         return None
 
     def _compute_gizmo_axis_delta(self, ev, axis: str) -> np.ndarray | None:
-        mats = self._get_mvp()
+        mats = self._gizmo_drag_mats
+        if mats is None:
+            mats = self._get_mvp()
         if mats is None or self.gizmo_anchor is None:
             return None
-        viewport, mvp, width, height, dpr = mats
+        mvp, width, height = mats
         rot_mat, scale_vec = self._rotation_matrix_and_scale()
-        anchor_world = self._apply_transform(self.gizmo_anchor.reshape(1, 3))[0]
         axis_len = self.gizmo_axis_len
-        axis_dir_local = {
-            "x": np.array([1.0, 0.0, 0.0]),
-            "y": np.array([0.0, 1.0, 0.0]),
-            "z": np.array([0.0, 0.0, 1.0]),
-        }.get(axis)
-        if axis_dir_local is None:
+        axis_idx = "xyz".find(axis)
+        if axis_idx < 0:
             return None
+        axis_dir_local = _UNIT_AXES[axis_idx]
 
         axis_dir_disp = rot_mat @ (axis_dir_local * scale_vec)
-        p0 = anchor_world
-        p1 = self._apply_transform(np.array([self.gizmo_anchor + axis_dir_local * axis_len], dtype=float))[0]
-        pts = self._to_view_space(np.vstack([p0, p1]))
-        screen = self._project_points_to_screen(pts, viewport, mvp, width, height, dpr)
-        if screen.shape[0] < 2 or np.any(~np.isfinite(screen)):
+        # Project the anchor and all tips in one go and keep the dragged axis
+        pts = self._working_to_view(self._gizmo_points())
+        screen = self._project_points_to_screen(pts, mvp, width, height)
+        a, b = screen[0], screen[axis_idx + 1]
+        if not (np.isfinite(a).all() and np.isfinite(b).all()):
             return None
-        a, b = screen[0], screen[1]
         seg = b - a
         seg_len = np.linalg.norm(seg)
         if seg_len < 1e-3:
@@ -844,20 +1194,23 @@ class Visualizer3DWidget(QWidget):
         delta_working = delta_working * inv_scale
         return delta_working
 
-    def _project_points_to_screen(self, pts: np.ndarray, viewport, mvp, width: float, height: float, dpr: float) -> np.ndarray:
-        screen_pts = np.full((len(pts), 2), np.nan, dtype=float)
-        for i, p in enumerate(pts):
-            v = mvp * QVector4D(float(p[0]), float(p[1]), float(p[2]), 1.0)
-            w = v.w()
-            if w == 0:
-                continue
-            x_ndc = v.x() / w
-            y_ndc = v.y() / w
-            screen_pts[i, 0] = (x_ndc + 1.0) * 0.5 * width
-            screen_pts[i, 1] = (1.0 - y_ndc) * 0.5 * height
-        return screen_pts
+    def _gizmo_points(self) -> np.ndarray:
+        """Gizmo anchor followed by its x, y and z axis tips (working space), in a reused buffer."""
+        buf = self._gizmo_pts_buf
+        buf[:] = self.gizmo_anchor
+        for i in range(3):
+            buf[i + 1, i] += self.gizmo_axis_len
+        return buf
+
+    def _project_points_to_screen(self, pts: np.ndarray, mvp: np.ndarray, width: float, height: float) -> np.ndarray:
+        return project_points(np.asarray(pts, dtype=float), mvp, width, height)
 
     def _get_mvp(self):
+        """(mvp, width, height) for the current camera, or None if Qt can't supply the matrices.
+
+        mvp is the row-major 4x4 projection * view as a contiguous NumPy array;
+        width/height are the view size in device pixels.
+        """
         try:
             viewport = self.view.getViewport()
             proj = self.view.projectionMatrix(viewport, viewport)
@@ -865,22 +1218,48 @@ class Visualizer3DWidget(QWidget):
             mvp = proj * view
         except Exception:
             return None
+        # Pull the 16 floats out of Qt once (copyDataTo is row-major); every projection reuses this array
+        mvp_np = np.array(mvp.copyDataTo(), dtype=float).reshape(4, 4)
         dpr = float(self.view.devicePixelRatioF())
         width = max(1.0, self.view.width() * dpr)
         height = max(1.0, self.view.height() * dpr)
-        return viewport, mvp, width, height, dpr
+        return mvp_np, width, height
 
     def _rotation_matrix_and_scale(self):
-        rx, ry, rz = [np.deg2rad(v) for v in self.current_transform["rotation"]]
-        cx, sx_sin = np.cos(rx), np.sin(rx)
-        cy, sy_sin = np.cos(ry), np.sin(ry)
-        cz, sz_sin = np.cos(rz), np.sin(rz)
-        rx_mat = np.array([[1, 0, 0], [0, cx, -sx_sin], [0, sx_sin, cx]])
-        ry_mat = np.array([[cy, 0, sy_sin], [0, 1, 0], [-sy_sin, 0, cy]])
-        rz_mat = np.array([[cz, -sz_sin, 0], [sz_sin, cz, 0], [0, 0, 1]])
-        rot_mat = rz_mat @ ry_mat @ rx_mat
-        scale_vec = np.array(self.current_transform["scale"], dtype=float)
-        return rot_mat, scale_vec
+        return self._cached_rot_mat, self._cached_scale_vec
+
+    def _update_transform_cache(self):
+        """Rebuild the cached rotation matrix, scale and translation from current_transform."""
+        key = tuple(
+            tuple(float(v) for v in self.current_transform[name]) for name in ("rotation", "scale", "translation")
+        )
+        if key == self._transform_cache_key:
+            return  # same transform as last time, e.g. set_transform re-sent by the controls
+        self._transform_cache_key = key
+        # plain floats: math is much cheaper than NumPy ufuncs on scalars
+        rx, ry, rz = (math.radians(v) for v in key[0])
+        cx, sx_sin = math.cos(rx), math.sin(rx)
+        cy, sy_sin = math.cos(ry), math.sin(ry)
+        cz, sz_sin = math.cos(rz), math.sin(rz)
+        # Rz @ Ry @ Rx written out term by term rather than built from three matrices
+        self._cached_rot_mat = np.array(
+            [
+                [cz * cy, cz * sy_sin * sx_sin - sz_sin * cx, cz * sy_sin * cx + sz_sin * sx_sin],
+                [sz_sin * cy, sz_sin * sy_sin * sx_sin + cz * cx, sz_sin * sy_sin * cx - cz * sx_sin],
+                [-sy_sin, cy * sx_sin, cy * cx],
+            ],
+            dtype=np.float32,
+        )
+        self._cached_scale_vec = np.array(self.current_transform["scale"], dtype=np.float32)
+        self._cached_trans_vec = np.array(self.current_transform["translation"], dtype=np.float32)
+        self._cached_view_mat = _WORLD_TO_VIEW @ self._cached_rot_mat * self._cached_scale_vec
+        self._cached_view_trans = _WORLD_TO_VIEW @ self._cached_trans_vec
+        self._point_size = self._point_size_from_scale()
+        self._transform_is_identity = (
+            not any(self.current_transform["rotation"])
+            and not any(self.current_transform["translation"])
+            and all(v == 1 for v in self.current_transform["scale"])
+        )
 
     def set_hint_text(self, text: str | None):
         """Show or hide the hint banner above the view."""
@@ -0,0 +1,138 @@
+"""
+Vectorised NumPy helpers for picking and line drawing in the 3D visualizer.
+"""
+
+import numpy as np
+
+
+def project_points(pts, mvp, width, height, screen_out=None):
+    """
+    Project Nx3 view-space points through a row-major 4x4 MVP into pixel coords.
+
+    Writes into screen_out (Nx2) when given, else a new float64 array, and
+    returns it. Rows with w == 0 are NaN.
+    """
+    if screen_out is None:
+        screen_out = np.empty((len(pts), 2), dtype=float)
+    # one (N,3) @ (3,4) product; the translation column stands in for a homogeneous 1
+    clip = pts @ mvp[:, :3].T + mvp[:, 3]
+    w = clip[:, 3]
+    valid = w != 0
+    ndc = clip[valid, :2] / w[valid, None]
+    screen_out[:] = np.nan
+    screen_out[valid, 0] = (ndc[:, 0] + 1.0) * 0.5 * width
+    screen_out[valid, 1] = (1.0 - ndc[:, 1]) * 0.5 * height
+    return screen_out
+
+
+def project_and_pick(pts, mvp, width, height, mx, my, screen_out):
+    """
+    Project Nx3 view-space points through a row-major 4x4 MVP into pixel coords.
+
+    Fills screen_out (Nx2, NaN where w == 0) and returns (index, squared pixel
+    distance) of the point nearest (mx, my), or (-1, inf) if none projected.
+    """
+    project_points(pts, mvp, width, height, screen_out)
+    return nearest_screen_point(screen_out, mx, my)
+
+
+def nearest_screen_point(screen, mx, my):
+    """
+    Return (index, squared pixel distance) of the screen point nearest (mx, my).
+
+    NaN rows are skipped; returns (-1, inf) when there is no finite point.
+    """
+    dx = screen[:, 0] - mx
+    dy = screen[:, 1] - my
+    dists2 = dx * dx + dy * dy
+    dists2[np.isnan(dists2)] = np.inf
+    if len(dists2) == 0 or not np.isfinite(dists2).any():
+        return -1, np.inf
+    nearest = int(np.argmin(dists2))
+    return nearest, float(dists2[nearest])
+
+
+def gated_segments(pts, scale, adj_mask):
+    """
+    Interleaved (start, end) indices of the sequential segments worth drawing.
+
+    Segment i joins pts[i] and pts[i + 1]. It is kept when adj_mask[i] is set
+    and its scaled length is under 1.5x the average of the first 10
+    segments. Needs at least two points.
+    """
+    deltas = (pts[1:] - pts[:-1]) * scale
+    dists2 = (deltas * deltas).sum(axis=1)
+    avg = np.sqrt(dists2[:min(10, len(dists2))]).mean()
+    keep = np.nonzero(adj_mask & (dists2 < (avg * 1.5) ** 2))[0]
+    idx = np.empty(2 * keep.size, dtype=np.intp)
+    idx[0::2] = keep
+    idx[1::2] = keep + 1
+    return idx
+
+
+def build_screen_grid(screen, width, height, cell):
+    """
+    Bucket projected points into square cells of `cell` pixels for pick queries.
+
+    Only points within one cell of the viewport are indexed, since nothing
+    further out can be within `cell` pixels of the cursor. Returns
+    (nx, ny, members, starts): the point indices of cell k are
+    members[starts[k]:starts[k + 1]], with cells laid out row by row.
+    """
+    nx = int(width // cell) + 3
+    ny = int(height // cell) + 3
+    with np.errstate(invalid="ignore"):
+        gx = np.floor(screen[:, 0] / cell) + 1
+        gy = np.floor(screen[:, 1] / cell) + 1
+        inside = (gx >= 0) & (gx < nx) & (gy >= 0) & (gy < ny)  # NaN rows fall out here
+    idx = np.nonzero(inside)[0]
+    keys = gy[idx].astype(np.intp) * nx + gx[idx].astype(np.intp)
+    order = np.argsort(keys, kind="stable")
+    starts = np.zeros(nx * ny + 1, dtype=np.intp)
+    np.cumsum(np.bincount(keys, minlength=nx * ny), out=starts[1:])
+    return nx, ny, idx[order], starts
+
+
+def grid_nearest(screen, grid, mx, my, cell):
+    """
+    Nearest indexed point to (mx, my) among the cursor's cell and its 8 neighbours.
+
+    Returns (index, squared pixel distance), or (-1, inf) if those cells are
+    empty. Any point within `cell` pixels of the cursor is always a candidate.
+    """
+    nx, ny, members, starts = grid
+    cx = min(max(int(mx // cell) + 1, 0), nx - 1)
+    cy = min(max(int(my // cell) + 1, 0), ny - 1)
+    x0 = max(cx - 1, 0)
+    x1 = min(cx + 2, nx)
+    # neighbouring cells in a row are adjacent in the layout, so each row is one slice
+    chunks = [members[starts[gy * nx + x0]:starts[gy * nx + x1]] for gy in range(max(cy - 1, 0), min(cy + 2, ny))]
+    candidates = np.concatenate(chunks)
+    if candidates.size == 0:
+        return -1, np.inf
+    dx = screen[candidates, 0] - mx
+    dy = screen[candidates, 1] - my
+    dists2 = dx * dx + dy * dy
+    best = dists2.min()
+    # lowest index wins ties, matching a linear scan
+    return int(candidates[dists2 == best].min()), float(best)
+
+
+def point_segment_distances(point, starts, ends, min_length=1e-3):
+    """
+    Pixel distance from a 2D point to each screen-space segment starts[i] -> ends[i].
+
+    Segments with a non-finite end or shorter than min_length get inf, so they
+    never win a nearest-segment test.
+    """
+    min_len2 = min_length * min_length
+    seg = ends - starts
+    len2 = (seg * seg).sum(axis=1)
+    rel = point - starts
+    # every segment goes through the same arithmetic; degenerate ones are masked out at the end
+    with np.errstate(invalid="ignore"):
+        t = np.clip((rel * seg).sum(axis=1) / np.maximum(len2, min_len2), 0.0, 1.0)
+        off = rel - t[:, None] * seg
+        dists = np.sqrt((off * off).sum(axis=1))
+        ok = np.isfinite(dists) & (len2 >= min_len2)  # NaN/inf ends leave NaN in len2 or dists
+    return np.where(ok, dists, np.inf)
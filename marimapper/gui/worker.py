@@ -1,16 +1,81 @@
 """
 Worker thread for monitoring scanner status and queues.
 
-This thread polls the frame queue and detector update queue to emit
+This thread waits on the frame queue and detector update queue to emit
 Qt signals for updating the GUI in a thread-safe manner.
 """
 
+import selectors
+import sys
 import time
-from multiprocessing import Queue
+from multiprocessing.connection import wait
+from queue import Empty
 from typing import Union, List
 from PyQt6.QtCore import QThread
 from marimapper.gui.signals import MariMapperSignals
-from marimapper.queues import Queue2D, DetectionControlEnum
+from marimapper.queues import BaseQueue, FrameQueue, Queue2D, DetectionControlEnum
+
+# Longest the monitor sleeps with no queue activity, so stop() is still noticed promptly
+IDLE_WAIT_S = 0.25
+# Warn once if no camera frame has arrived this long after the monitor starts
+NO_FRAME_WARNING_S = 3.0
+# Frames are passed to the GUI at most this often (30 Hz); anything faster is dropped unseen
+FRAME_INTERVAL_S = 1 / 30
+
+
+def _drain(source, handler):
+    """Pass every item currently waiting in source to handler, without blocking."""
+    while True:
+        try:
+            item = source.get_nowait()
+        except Empty:
+            return
+        handler(item)
+
+
+def _reader(source):
+    """The pipe end a queue's items arrive on; readable whenever something is waiting."""
+    if isinstance(source, BaseQueue):
+        return source.reader()
+    return source._reader
+
+
+def _latest(source):
+    """Empty source without blocking and return the newest item, or None if there was nothing."""
+    latest = None
+    while True:
+        try:
+            latest = source.get_nowait()
+        except Empty:
+            return latest
+
+
+class _PipeWaiter:
+    """
+    Blocks until one of a fixed set of queue pipes is readable.
+
+    On POSIX the pipes stay registered with one selector (epoll on Linux) for
+    the life of the waiter, where connection.wait would build and fill a new
+    one on every call. Windows pipes can't be selected, so it uses wait there.
+    """
+
+    def __init__(self, readers):
+        self._readers = readers
+        self._selector = None
+        if sys.platform != "win32":
+            self._selector = selectors.DefaultSelector()
+            for reader in readers:
+                self._selector.register(reader, selectors.EVENT_READ)
+
+    def wait(self, timeout: float):
+        if self._selector is None:
+            wait(self._readers, timeout=timeout)
+        else:
+            self._selector.select(timeout)
+
+    def close(self):
+        if self._selector is not None:
+            self._selector.close()
 
 
 class StatusMonitorThread(QThread):
@@ -24,7 +89,7 @@ class StatusMonitorThread(QThread):
     def __init__(
         self,
         signals: MariMapperSignals,
-        frame_queues: Union[Queue, List[Queue]],
+        frame_queues: Union[FrameQueue, List[FrameQueue]],
         detector_update_queue: Queue2D,
         info_3d_queue=None,
         data_3d_queue=None,
@@ -34,7 +99,7 @@ class StatusMonitorThread(QThread):
 
         Args:
             signals: MariMapperSignals object for emitting Qt signals
-            frame_queues: Single Queue or List[Queue] containing video frames from detector(s)
+            frame_queues: Single FrameQueue or List[FrameQueue] containing video frames from detector(s)
             detector_update_queue: Queue2D for detection status updates
             info_3d_queue: Queue3DInfo for 3D reconstruction status updates
             data_3d_queue: Queue3D for full 3D LED data (for visualization)
@@ -54,115 +119,157 @@ class StatusMonitorThread(QThread):
         self.info_3d_queue = info_3d_queue
         self.data_3d_queue = data_3d_queue
         self.running = True
+        # Log lines gathered while handling one wake, sent to the GUI as a single log_batch.
+        # Each is (level, template, args); the log widget does the formatting.
+        self._pending_logs: list[tuple] = []
+        # Cleared while the log panel is hidden, so non-error lines are dropped before formatting
+        self._log_enabled = True
+        self._detector_handlers = {
+            DetectionControlEnum.DETECT: self._on_detect,
+            DetectionControlEnum.SKIP: self._on_skip,
+            DetectionControlEnum.DONE: self._on_done,
+            DetectionControlEnum.FAIL: self._on_fail,
+            DetectionControlEnum.DELETE: self._on_delete,
+        }
 
     def run(self):
-        """Main thread loop - polls queues and emits signals."""
+        """Main thread loop - waits for queue activity and emits signals."""
+        self._log("info", "Status monitor thread started")
+
+        update_sources = [self.detector_update_queue, self.info_3d_queue, self.data_3d_queue]
+        update_readers = [_reader(q) for q in update_sources if q is not None]
+        frame_readers = [_reader(q) for q in self.frame_queues if q is not None]
+        updates_waiter = _PipeWaiter(update_readers)
+        any_waiter = _PipeWaiter(frame_readers + update_readers)
+        try:
+            self._monitor(updates_waiter, any_waiter)
+        finally:
+            updates_waiter.close()
+            any_waiter.close()
+
+    def _monitor(self, updates_waiter: _PipeWaiter, any_waiter: _PipeWaiter):
+        """Loop until stop(), waking on queue activity to forward frames and updates."""
         frame_count = 0
-        loop_count = 0
-        self.signals.log_message.emit("info", "Status monitor thread started")
+        started = time.monotonic()
+        warned_no_frames = False
+        # Absolute deadline for the next frame emit, so the rate holds however long each wake takes
+        next_frame_at = started
 
         while self.running:
-            loop_count += 1
             try:
-                # Poll all frame queues (non-blocking)
-                for camera_id, frame_queue in enumerate(self.frame_queues):
-                    if frame_queue is not None and not frame_queue.empty():
-                        try:
-                            frame = frame_queue.get_nowait()
-                            frame_count += 1
-                            if frame_count <= 3:  # Log first 3 frames
-                                cam_label = f"camera {camera_id}" if self.multi_camera else "camera"
-                                self.signals.log_message.emit("info", f"Frame {frame_count} received from {cam_label}: shape={frame.shape}")
-
-                            # Emit appropriate signal based on mode
-                            if self.multi_camera:
-                                self.signals.frame_ready_multi.emit(camera_id, frame)
-                            else:
-                                self.signals.frame_ready.emit(frame)
-                        except Exception as e:
-                            if frame_count == 0:  # Only log if we haven't received any frames yet
-                                self.signals.log_message.emit("warning", f"Error getting frame from camera {camera_id}: {e}")
-                            pass  # Queue empty, ignore
-
-                # Poll detector update queue (non-blocking)
-                if not self.detector_update_queue.empty():
-                    try:
-                        control, data = self.detector_update_queue.get()
-
-                        if control == DetectionControlEnum.DETECT:
-                            # LED detected
-                            self.signals.led_detected.emit(data)
-                            self.signals.log_message.emit(
-                                "info", f"LED {data.led_id} detected at view {data.view_id}"
-                            )
-
-                        elif control == DetectionControlEnum.SKIP:
-                            # LED skipped (not found)
-                            self.signals.led_skipped.emit(data)
-                            self.signals.log_message.emit(
-                                "warning", f"LED {data} not found, skipping"
-                            )
-
-                        elif control == DetectionControlEnum.DONE:
-                            # Scan completed successfully
-                            view_id = data
-                            self.signals.scan_completed.emit(view_id)
-                            self.signals.log_message.emit(
-                                "success", f"View {view_id} scan completed successfully"
-                            )
-
-                        elif control == DetectionControlEnum.FAIL:
-                            # Scan failed
-                            self.signals.scan_failed.emit("Detection failed - LED visible when all should be off")
-                            self.signals.log_message.emit(
-                                "error", "Scan failed - LED visible when all should be off"
-                            )
-
-                        elif control == DetectionControlEnum.DELETE:
-                            # View deleted due to camera movement
-                            view_id = data
-                            self.signals.view_deleted.emit(view_id)
-                            self.signals.log_message.emit(
-                                "warning", f"View {view_id} deleted due to camera movement"
-                            )
-
-                    except:
-                        pass  # Queue empty or other error, ignore
-
-                # Poll 3D info queue for reconstruction status updates
-                if self.info_3d_queue is not None and not self.info_3d_queue.empty():
-                    try:
-                        led_info_dict = self.info_3d_queue.get_nowait()
-                        self.signals.log_message.emit("info", f"Received 3D info update: {len(led_info_dict)} LEDs")
-                        self.signals.reconstruction_updated.emit(led_info_dict)
-                    except Exception as e:
-                        self.signals.log_message.emit("warning", f"Error reading 3D info queue: {e}")
-                        pass  # Queue empty, ignore
-
-                # Poll 3D data queue for full 3D visualization
-                if self.data_3d_queue is not None and not self.data_3d_queue.empty():
-                    try:
-                        leds_3d = self.data_3d_queue.get_nowait()
-                        if len(leds_3d) > 0:
-                            self.signals.log_message.emit("info", f"Received 3D data update: {len(leds_3d)} LEDs")
-                            self.signals.points_3d_updated.emit(leds_3d)
-                    except Exception as e:
-                        self.signals.log_message.emit("warning", f"Error reading 3D data queue: {e}")
-                        pass  # Queue empty, ignore
-
-                # Periodic diagnostic log (every 3 seconds, ~90 loops at 30Hz)
-                if loop_count == 90 and frame_count == 0:
-                    queue_status = [q.empty() if q is not None else True for q in self.frame_queues]
-                    self.signals.log_message.emit("warning",
-                        f"No frames received yet. Queue(s) empty: {queue_status}")
+                # Sleep until any queue has data instead of polling on a fixed tick. Until the next
+                # frame is due, only the update queues can wake us; waiting frames would spin the loop.
+                remaining = next_frame_at - time.monotonic()
+                if remaining > 0:
+                    updates_waiter.wait(min(remaining, IDLE_WAIT_S))
+                else:
+                    any_waiter.wait(IDLE_WAIT_S)
 
-                # Sleep briefly to avoid busy-waiting
-                time.sleep(0.033)  # ~30 Hz polling rate
+                now = time.monotonic()
+                frames_due = now >= next_frame_at
+                emitted = False
+
+                # Only the newest frame per camera is worth displaying; older ones are dropped unseen
+                for camera_id, frame_queue in enumerate(self.frame_queues if frames_due else ()):
+                    if frame_queue is None:
+                        continue
+                    frame = frame_queue.get_latest_nowait()
+                    if frame is None:
+                        continue
+                    frame_count += 1
+                    if frame_count <= 3:  # Log first 3 frames
+                        cam_label = f"camera {camera_id}" if self.multi_camera else "camera"
+                        self._log("info", "Frame %d received from %s: shape=%s", frame_count, cam_label, frame.shape)
+
+                    # Emit appropriate signal based on mode
+                    if self.multi_camera:
+                        self.signals.frame_ready_multi.emit(camera_id, frame)
+                    else:
+                        self.signals.frame_ready.emit(frame)
+                    emitted = True
+
+                if emitted:
+                    next_frame_at += FRAME_INTERVAL_S
+                    if next_frame_at < now:
+                        next_frame_at = now + FRAME_INTERVAL_S  # fell behind or was idle: don't catch up
+
+                # Drain the detector update and 3D queues (non-blocking)
+                for update in self.detector_update_queue.try_get_batch():
+                    self._handle_detector_update(update)
+                if self.info_3d_queue is not None:
+                    _drain(self.info_3d_queue, self._handle_3d_info)
+                if self.data_3d_queue is not None:
+                    # each snapshot is the full LED set, so only the newest one needs drawing
+                    leds_3d = _latest(self.data_3d_queue)
+                    if leds_3d is not None:
+                        self._handle_3d_data(leds_3d)
+
+                # One-off diagnostic if the camera(s) stay silent
+                if not warned_no_frames and frame_count == 0 and time.monotonic() - started >= NO_FRAME_WARNING_S:
+                    warned_no_frames = True
+                    queue_status = [q.empty() if q is not None else True for q in self.frame_queues]
+                    self._log("warning", "No frames received yet. Queue(s) empty: %s", queue_status)
 
             except Exception as e:
-                self.signals.log_message.emit("error", f"Monitor thread error: {str(e)}")
+                self._log("error", "Monitor thread error: %s", e)
                 time.sleep(0.1)
 
+            self._flush_logs()
+
+    def set_log_enabled(self, enabled: bool):
+        """Turn log lines below error level on or off, e.g. while the log panel is hidden."""
+        self._log_enabled = enabled
+
+    def _log(self, level: str, template: str, *args):
+        """Queue a log line for the next log_batch emit; formatting is left to the receiving slot."""
+        if self._log_enabled or level == "error":
+            self._pending_logs.append((level, template, args))
+
+    def _flush_logs(self):
+        """Send the gathered log lines to the GUI in one signal."""
+        if self._pending_logs:
+            self.signals.log_batch.emit(self._pending_logs)
+            self._pending_logs = []
+
+    def _handle_detector_update(self, update):
+        """Emit the signals for one (control, data) detector update."""
+        control, data = update
+        handler = self._detector_handlers.get(control)
+        if handler is not None:
+            handler(data)
+
+    def _on_detect(self, led):
+        self.signals.led_detected.emit(led)
+        self._log("info", "LED %d detected at view %d", led.led_id, led.view_id)
+
+    def _on_skip(self, led_id):
+        self.signals.led_skipped.emit(led_id)
+        self._log("warning", "LED %s not found, skipping", led_id)
+
+    def _on_done(self, view_id):
+        self.signals.scan_completed.emit(view_id)
+        self._log("success", "View %s scan completed successfully", view_id)
+
+    def _on_fail(self, _data):
+        self.signals.scan_failed.emit("Detection failed - LED visible when all should be off")
+        self._log("error", "Scan failed - LED visible when all should be off")
+
+    def _on_delete(self, view_id):
+        # View deleted due to camera movement
+        self.signals.view_deleted.emit(view_id)
+        self._log("warning", "View %s deleted due to camera movement", view_id)
+
+    def _handle_3d_info(self, led_info_dict):
+        """Forward a reconstruction status update to the status table."""
+        self._log("info", "Received 3D info update: %d LEDs", len(led_info_dict))
+        self.signals.reconstruction_updated.emit(led_info_dict)
+
+    def _handle_3d_data(self, leds_3d):
+        """Forward a full 3D LED snapshot to the visualizer."""
+        if len(leds_3d) > 0:
+            self._log("info", "Received 3D data update: %d LEDs", len(leds_3d))
+            self.signals.points_3d_updated.emit(leds_3d)
+
     def stop(self):
         """Stop the monitoring thread."""
         self.running = False
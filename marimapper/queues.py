@@ -1,7 +1,18 @@
 from marimapper.led import LED2D, LED3D, LEDInfo
-from multiprocessing import Queue
-from typing import Union, Any
+from multiprocessing import Lock, Pipe, Queue
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty, Full
+from typing import Optional, Union, Any
 from enum import Enum
+import struct
+import time
+import numpy as np
+
+# Large enough for a 4K BGR frame; pages are only committed once a frame is written to them
+MAX_FRAME_BYTES = 3840 * 2160 * 3
+
+# slot, height, width, channels (0 for a 2D frame), numpy dtype character
+_FRAME_HEADER = struct.Struct("<HIIBc")
 
 
 class DetectionControlEnum(Enum):
@@ -20,6 +31,10 @@ class BaseQueue:
     def empty(self) -> bool:
         return self._queue.empty()
 
+    def reader(self):
+        """Connection that is readable while items are waiting, for use with multiprocessing.connection.wait."""
+        return self._queue._reader
+
     def get_nowait(self):
         """Non-blocking get passthrough to underlying queue."""
         return self._queue.get_nowait()
@@ -46,6 +61,22 @@ class Queue2D(BaseQueue):
     def get(self, timeout=None) -> tuple[DetectionControlEnum, Any]:
         return self._queue.get(timeout=timeout)
 
+    def try_get_batch(self, limit: int = 64) -> list[tuple[DetectionControlEnum, Any]]:
+        """Return up to limit waiting updates without blocking; empty if there are none."""
+        batch = []
+        for _ in range(limit):
+            try:
+                batch.append(self._queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def get_blocking_batch(self, timeout=None, limit: int = 64) -> list[tuple[DetectionControlEnum, Any]]:
+        """Block for one update like get(), then take whatever else is already waiting."""
+        batch = [self._queue.get(timeout=timeout)]
+        batch.extend(self.try_get_batch(limit - 1))
+        return batch
+
 
 class Queue3D(BaseQueue):
 
@@ -63,3 +94,104 @@ class Queue3DInfo(BaseQueue):
 
     def get(self, timeout=None) -> dict[int, LEDInfo]:
         return self._queue.get(timeout=timeout)
+
+
+class FrameQueue(BaseQueue):
+    """
+    Camera frames for the GUI, passed through a few shared memory slots.
+
+    Only a small fixed-size header naming the slot, shape and dtype goes through
+    a pipe, so a frame is copied once into its slot and once out again instead
+    of being pickled both ways. The queue holds at most one frame per slot; when
+    all are waiting the oldest one is overwritten.
+    """
+
+    def __init__(self, slots: int = 4, max_frame_bytes: int = MAX_FRAME_BYTES):
+        # Headers of waiting frames. Unlike a Queue there is no feeder thread, so a header is readable
+        # as soon as put_nowait returns. Both ends read (the producer to evict), hence the lock.
+        self._ready_out, self._ready_in = Pipe(duplex=False)
+        self._read_lock = Lock()
+        # Free slot numbers go straight down a one-way pipe: no feeder thread to wait for and no lock,
+        # as only the consumer's thread ever returns slots and only the producer takes them
+        self._free_out, self._free_in = Pipe(duplex=False)
+        self._shms = [SharedMemory(create=True, size=max_frame_bytes) for _ in range(slots)]
+        for slot in range(slots):
+            self._free_in.send(slot)
+        self._owner = True
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_owner"] = False  # only the creating process unlinks the slots
+        return state
+
+    def empty(self) -> bool:
+        return not self._ready_out.poll()
+
+    def reader(self):
+        return self._ready_out
+
+    def put_nowait(self, image: np.ndarray) -> None:
+        """Copy image into a slot, reusing the oldest waiting frame's slot if none are free."""
+        if image.nbytes > self._shms[0].size:
+            raise ValueError(f"Frame of {image.nbytes} bytes does not fit a {self._shms[0].size} byte slot")
+        if image.ndim not in (2, 3):
+            raise ValueError(f"Frame must be 2D or 3D, not {image.ndim}D")
+        if self._free_out.poll():
+            slot = self._free_out.recv()
+        else:
+            # Every slot is waiting to be read, so reuse the oldest
+            try:
+                slot = _FRAME_HEADER.unpack(self._pop_ready())[0]
+            except Empty:
+                raise Full from None  # the reader is still copying out of the only slot
+        np.copyto(np.ndarray(image.shape, image.dtype, buffer=self._shms[slot].buf), image)
+        channels = image.shape[2] if image.ndim == 3 else 0
+        header = _FRAME_HEADER.pack(slot, image.shape[0], image.shape[1], channels, image.dtype.char.encode())
+        self._ready_in.send_bytes(header)
+
+    def get(self, timeout=None) -> np.ndarray:
+        return self._take(self._pop_ready(timeout))
+
+    def get_nowait(self) -> np.ndarray:
+        return self._take(self._pop_ready())
+
+    def get_latest_nowait(self) -> Optional[np.ndarray]:
+        """Return the newest waiting frame, freeing any older ones unread, or None if there is none."""
+        latest = None
+        while True:
+            try:
+                item = self._pop_ready()
+            except Empty:
+                break
+            if latest is not None:
+                self._free_in.send(_FRAME_HEADER.unpack(latest)[0])
+            latest = item
+        return None if latest is None else self._take(latest)
+
+    def _pop_ready(self, timeout: Optional[float] = 0.0) -> bytes:
+        """Take the oldest waiting header, raising Empty if none arrives within timeout (None waits forever)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            # Wait outside the lock so a blocked reader never holds up the producer's eviction;
+            # the lock is only held for a poll and a header-sized read
+            if not self._ready_out.poll(remaining):
+                raise Empty
+            with self._read_lock:
+                if self._ready_out.poll():
+                    return self._ready_out.recv_bytes()
+
+    def _take(self, header: bytes) -> np.ndarray:
+        slot, height, width, channels, dtype = _FRAME_HEADER.unpack(header)
+        shape = (height, width, channels) if channels else (height, width)
+        try:
+            return np.ndarray(shape, dtype.decode(), buffer=self._shms[slot].buf).copy()
+        finally:
+            self._free_in.send(slot)
+
+    def close(self) -> None:
+        """Release the shared memory slots; the creating process also removes them."""
+        for shm in self._shms:
+            shm.close()
+            if self._owner:
+                shm.unlink()
@@ -7,8 +7,9 @@ from pathlib import Path
 from marimapper.detector_process import DetectorProcess
 from marimapper.coordinator_process import CoordinatorProcess
 from marimapper.detector_worker_process import DetectorWorkerProcess
-from marimapper.queues import Queue2D, Queue3D, Queue3DInfo, DetectionControlEnum
-from multiprocessing import get_logger, set_start_method, get_start_method
+from marimapper.queues import FrameQueue, Queue2D, Queue3D, Queue3DInfo, DetectionControlEnum
+from multiprocessing import get_logger, get_start_method
+from multiprocessing.connection import wait
 from marimapper.file_tools import get_all_2d_led_maps
 from marimapper.utils import get_user_confirmation
 from marimapper.visualize_process import VisualiseProcess
@@ -16,6 +17,9 @@ from marimapper.led import last_view
 from marimapper.file_writer_process import FileWriterProcess
 from functools import partial
 from typing import Optional, List
+import sys
+import time
+from queue import Empty
 
 # This is to do with an issue with open3d bug in estimate normals
 # https://github.com/isl-org/Open3D/issues/1428
@@ -23,18 +27,53 @@ from typing import Optional, List
 # add_normals is also in the wrong file, it should be in sfm.py, but this causes a dependancy crash
 # I think there is something very wrong with open3d.geometry.PointCloud.estimate_normals()
 # See https://github.com/TheMariday/marimapper/issues/46
-# I would prefer not to call this here as it means that any process being called after this will have a different
-# spawn method, however it makes tests more robust in isolation
+# scanner_cli.main and gui_cli.main set spawn before building a Scanner (as does the repo-root conftest.py for tests);
+# Scanner only checks it (the platform default counts), so it never switches the start method for the caller
 # This is only an issue on Linux, as on Windows and Mac, the default start method is spawn
 
 logger = get_logger()
 
+# check_for_crash probes the processes at most this often; a crash is still caught within this window
+CRASH_CHECK_INTERVAL_S = 0.25
+# wait_for_scan checks the processes are still alive whenever this passes without a detector update
+SCAN_POLL_S = 0.25
+
+
+def is_multi_camera(axis_configs: Optional[List[dict]]) -> bool:
+    """True when more than one camera config is given, which puts Scanner in multi-camera mode."""
+    return bool(axis_configs) and len(axis_configs) > 1
+
 
 def join_with_warning(process_to_join, process_name, timeout=10):
     logger.debug(f"{process_name} stopping...")
-    process_to_join.join(
-        timeout=timeout
-    )  # Strangely the return code for join does not match the exitcode attribute
+    # The sentinel becomes ready the moment the process exits, so this returns early rather than at the timeout
+    wait([process_to_join.sentinel], timeout=timeout)
+    _reap_with_warning(process_to_join, process_name, timeout)
+
+
+def join_all_with_warning(processes_to_join, timeout=10):
+    """join_with_warning for (process, name) pairs that have all been told to stop, waiting on them together."""
+    for _, process_name in processes_to_join:
+        logger.debug(f"{process_name} stopping...")
+
+    pending = [process.sentinel for process, _ in processes_to_join]
+    deadline = time.monotonic() + timeout
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        exited = wait(pending, timeout=remaining)
+        pending = [sentinel for sentinel in pending if sentinel not in exited]
+
+    for process, process_name in processes_to_join:
+        _reap_with_warning(process, process_name, timeout)
+
+
+def _reap_with_warning(process_to_join, process_name, timeout):
+    """Collect the exit code of a process already waited on, forcing it down if it is still running."""
+    # The sentinel closes a moment before the exit status can be collected, so give join a brief timeout
+    # rather than polling with 0. Strangely the return code for join does not match the exitcode attribute
+    process_to_join.join(timeout=0.1)
 
     if process_to_join.exitcode is None:
         logger.warning(f"{process_name} failed to stop gracefully after {timeout}s, forcing termination")
@@ -82,9 +121,10 @@ class Scanner:
         """
         logger.debug("initialising scanner")
         # VERY important, see top of file
-        # Only set if not already set (GUI may have already set it)
-        if get_start_method(allow_none=True) != "spawn":
-            set_start_method("spawn")
+        if get_start_method() != "spawn":
+            raise RuntimeError(
+                'Scanner requires the "spawn" start method, call multiprocessing.set_start_method("spawn") first'
+            )
 
         # Store common parameters
         self.output_dir = output_dir
@@ -96,9 +136,12 @@ class Scanner:
         self.led_end = led_end
         self.check_movement = check_movement
         self.frame_queue = frame_queue
+        # Only the GUI passes a frame queue; it shows its own progress, so no tqdm bar is drawn then
+        self._gui_mode = frame_queue is not None
+        self._last_crash_check = float("-inf")
 
         # Determine mode: multi-camera or single-camera
-        self.multi_camera_mode = axis_configs is not None and len(axis_configs) > 1
+        self.multi_camera_mode = is_multi_camera(axis_configs)
 
         # Initialize common components
         self.file_writer = FileWriterProcess(self.output_dir)
@@ -201,8 +244,7 @@ class Scanner:
             # Create per-camera frame queue if GUI is active
             worker_frame_queue = None
             if self.frame_queue is not None:  # GUI mode detected
-                from multiprocessing import Queue
-                worker_frame_queue = Queue(maxsize=3)
+                worker_frame_queue = FrameQueue()
                 self.worker_frame_queues.append(worker_frame_queue)
 
             worker = DetectorWorkerProcess(
@@ -249,12 +291,16 @@ class Scanner:
         )
 
     def check_for_crash(self):
+        now = time.monotonic()
+        if now - self._last_crash_check < CRASH_CHECK_INTERVAL_S:
+            return
+
         if self.multi_camera_mode:
             if not self.coordinator.is_alive():
                 raise Exception("Coordinator has stopped unexpectedly")
-            for i, worker in enumerate(self.detector_workers):
-                if not worker.is_alive():
-                    raise Exception(f"Detector worker {i} has stopped unexpectedly")
+            dead = next((i for i, worker in enumerate(self.detector_workers) if not worker.is_alive()), None)
+            if dead is not None:
+                raise Exception(f"Detector worker {dead} has stopped unexpectedly")
         else:
             if not self.detector.is_alive():
                 raise Exception("LED Detector has stopped unexpectedly")
@@ -268,6 +314,9 @@ class Scanner:
         if not self.file_writer.is_alive():
             raise Exception("File writer has stopped unexpectedly")
 
+        # only a clean pass is cached, so a failure is raised again on the next call
+        self._last_crash_check = now
+
     def create_detector_update_queue(self):
         """Return the detector update queue for GUI monitoring."""
         return self.detector_update_queue
@@ -342,13 +391,8 @@ class Scanner:
             self.renderer3d.stop()
             self.file_writer.stop()
 
-            # Join processes
-            join_with_warning(self.coordinator, "coordinator", timeout=3)
-            for i, worker in enumerate(self.detector_workers):
-                join_with_warning(worker, f"detector_worker_{i}", timeout=3)
-            join_with_warning(self.sfm, "SFM", timeout=3)
-            join_with_warning(self.file_writer, "File Writer", timeout=3)
-            join_with_warning(self.renderer3d, "Visualiser", timeout=3)
+            to_join = [(self.coordinator, "coordinator")]
+            to_join += [(worker, f"detector_worker_{i}") for i, worker in enumerate(self.detector_workers)]
         else:
             # Single camera mode (existing behavior)
             self.detector.stop()
@@ -356,10 +400,18 @@ class Scanner:
             self.renderer3d.stop()
             self.file_writer.stop()
 
-            join_with_warning(self.detector, "detector", timeout=3)
-            join_with_warning(self.sfm, "SFM", timeout=3)
-            join_with_warning(self.file_writer, "File Writer", timeout=3)
-            join_with_warning(self.renderer3d, "Visualiser", timeout=3)
+            to_join = [(self.detector, "detector")]
+
+        to_join += [(self.sfm, "SFM"), (self.file_writer, "File Writer"), (self.renderer3d, "Visualiser")]
+
+        try:
+            # Everything has already been told to stop, so wait for all of them at once;
+            # shutdown then takes as long as the slowest process rather than the sum of their timeouts
+            join_all_with_warning(to_join, timeout=3)
+        finally:
+            # shared memory outlives the process on Linux unless unlinked
+            for worker_frame_queue in self.worker_frame_queues:
+                worker_frame_queue.close()
 
         logger.debug("scanner closed")
 
@@ -370,29 +422,61 @@ class Scanner:
             unit="LEDs",
             desc="Capturing sequence",
             smoothing=0,
+            disable=self._gui_mode or sys.stderr is None or not sys.stderr.isatty(),
         ) as progress_bar:
 
-            while True:
-
-                control, data = self.detector_update_queue.get()
+            leds_seen = 0
 
-                if control == DetectionControlEnum.FAIL:
-                    logger.error("Scan failed")
-                    return False
+            def on_led(_data):
+                nonlocal leds_seen
+                leds_seen += 1
 
-                if control in [DetectionControlEnum.DETECT, DetectionControlEnum.SKIP]:
-                    progress_bar.update(1)
-                    progress_bar.refresh()
+            # Each handler returns the scan result, or None to keep waiting
+            handlers = {
+                DetectionControlEnum.DETECT: on_led,
+                DetectionControlEnum.SKIP: on_led,
+                DetectionControlEnum.FAIL: self._on_scan_failed,
+                DetectionControlEnum.DONE: self._on_scan_done,
+                DetectionControlEnum.DELETE: self._on_scan_deleted,
+            }
 
-                if control == DetectionControlEnum.DONE:
-                    done_view = data
-                    logger.info(f"Scan complete {done_view}")
-                    return True
+            while True:
 
-                if control == DetectionControlEnum.DELETE:
-                    view_id = data
-                    logger.info(f"Deleting scan {view_id}")
-                    return False
+                # Handle everything that arrived together, then move the bar once for the lot.
+                # The timeout lets a crashed detector be noticed instead of waiting forever
+                try:
+                    batch = self.detector_update_queue.get_blocking_batch(timeout=SCAN_POLL_S)
+                except Empty:
+                    self.check_for_crash()
+                    continue
+
+                result = None
+                for control, data in batch:
+                    result = handlers[control](data)
+                    if result is not None:
+                        break
+
+                if leds_seen:
+                    progress_bar.update(leds_seen)
+                    leds_seen = 0
+
+                if result is not None:
+                    return result
+
+    @staticmethod
+    def _on_scan_failed(_data):
+        logger.error("Scan failed")
+        return False
+
+    @staticmethod
+    def _on_scan_done(done_view):
+        logger.info(f"Scan complete {done_view}")
+        return True
+
+    @staticmethod
+    def _on_scan_deleted(view_id):
+        logger.info(f"Deleting scan {view_id}")
+        return False
 
     def mainloop(self):
 
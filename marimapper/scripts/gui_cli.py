@@ -17,11 +17,6 @@ import sys
 import os
 from pathlib import Path
 
-# CRITICAL: Set multiprocessing start method BEFORE importing PyQt6
-# This is required for Open3D compatibility on Linux
-if __name__ == "__main__":
-    multiprocessing.set_start_method("spawn", force=True)
-
 from PyQt6.QtWidgets import QApplication
 from marimapper.scripts.arg_tools import (
     parse_common_args,
@@ -37,6 +32,10 @@ from marimapper.gui.main_window import MainWindow
 def main():
     """Main entry point for MariMapper GUI."""
 
+    # Scanner needs spawn for Open3D on Linux, see marimapper/scanner.py. Set here rather than under
+    # __main__ so the installed console script, which calls main() directly, gets it too
+    multiprocessing.set_start_method("spawn", force=True)
+
     logger = multiprocessing.log_to_stderr()
     logger.setLevel(level=logging.INFO)  # Set to INFO to see detector process logs
 
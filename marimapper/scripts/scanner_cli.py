@@ -21,6 +21,10 @@ import os
 
 def main():
 
+    # Scanner needs spawn, see marimapper/scanner.py. Set here rather than under __main__ so the
+    # installed console script, which calls main() directly, gets it too
+    multiprocessing.set_start_method("spawn", force=True)
+
     logger = multiprocessing.log_to_stderr()
     logger.setLevel(level=logging.WARNING)
 
@@ -114,8 +118,11 @@ def main():
         axis_configs=axis_configs,
     )
 
-    scanner.mainloop()
-    scanner.close()
+    try:
+        scanner.mainloop()
+    finally:
+        # also on Ctrl+C or a crashed child, so no processes or shared memory outlive us
+        scanner.close()
 
 
 if __name__ == "__main__":
@@ -15,6 +15,7 @@ import open3d
 import numpy as np
 import math
 import time
+from queue import Empty
 from typing import Union
 
 logger = get_logger()
@@ -101,26 +102,32 @@ class SFM(Process):
 
         needs_initial_reconstruction = len(self.leds_2d) > 0
         update_info = True
+        # Enum members unpickle to the same singletons, so they can be bound once and compared with "is"
+        DETECT = DetectionControlEnum.DETECT
+        DONE = DetectionControlEnum.DONE
+        DELETE = DetectionControlEnum.DELETE
         while not self._exit_event.is_set():
 
             update_sfm = False
             print_overlap = False
             print_reconstructed = False
 
-            while not self._input_queue.empty():
-
-                control, data = self._input_queue.get()
-                if control == DetectionControlEnum.DETECT:
+            while True:
+                try:
+                    control, data = self._input_queue.get_nowait()
+                except Empty:
+                    break
+                if control is DETECT:
                     led2d = data
                     self.leds_2d.append(led2d)
                     update_sfm = True
                     print_reconstructed = False
 
-                if control == DetectionControlEnum.DONE:
+                if control is DONE:
                     print_overlap = True
                     print_reconstructed = True
                     update_info = True
-                if control == DetectionControlEnum.DELETE:
+                if control is DELETE:
                     view_id = data
                     self.leds_2d = [
                         led for led in self.leds_2d if led.view_id != view_id
@@ -1,9 +1,11 @@
 import numpy as np
 import open3d
 from multiprocessing import get_logger, Process, Event
+from multiprocessing.connection import wait
 from marimapper.queues import Queue3D
 from marimapper.led import LED3D, View, get_next, get_distance
 import time
+from queue import Empty
 
 logger = get_logger()
 
@@ -47,8 +49,12 @@ class VisualiseProcess(Process):
 
         while not self._exit_event.is_set():
 
-            if not self._input_queue.empty():
-                leds = self._input_queue.get()
+            try:
+                leds = self._input_queue.get_nowait()
+            except Empty:
+                leds = None
+
+            if leds is not None:
                 if len(leds) < 9:
                     continue
 
@@ -64,7 +70,8 @@ class VisualiseProcess(Process):
                 self._vis.update_renderer()
                 time.sleep(1 / 60)
             else:
-                time.sleep(1)
+                # Nothing to draw yet, so sleep until the first LEDs arrive rather than for a fixed second
+                wait([self._input_queue.reader()], timeout=1)
 
     def initialise_visualiser__(self):
         logger.debug("Renderer3D process initialising visualiser")
@@ -114,15 +121,19 @@ class VisualiseProcess(Process):
         self.line_set.lines = open3d.utility.Vector2iVector(l)
         self.line_set.colors = open3d.utility.Vector3dVector(c)
 
-        self.point_cloud.points = open3d.utility.Vector3dVector(
-            np.array([led.point.position for led in leds])
-        )
-        self.point_cloud.normals = open3d.utility.Vector3dVector(
-            np.array([led.point.normal for led in leds]) * 0.2
-        )
-        self.point_cloud.colors = open3d.utility.Vector3dVector(
-            np.array([led.get_color() for led in leds])
-        )
+        # fill all three per-LED arrays in a single pass over the leds
+        positions = np.empty((len(leds), 3))
+        normals = np.empty((len(leds), 3))
+        colors = np.empty((len(leds), 3))
+        for i, led in enumerate(leds):
+            positions[i] = led.point.position
+            normals[i] = led.point.normal
+            colors[i] = led.get_color()
+        normals *= 0.2
+
+        self.point_cloud.points = open3d.utility.Vector3dVector(positions)
+        self.point_cloud.normals = open3d.utility.Vector3dVector(normals)
+        self.point_cloud.colors = open3d.utility.Vector3dVector(colors)
 
         self.strip_set.points = self.point_cloud.points
 
@@ -135,7 +146,7 @@ class VisualiseProcess(Process):
 
         self.strip_set.lines = open3d.utility.Vector2iVector(strips)
         self.strip_set.colors = open3d.utility.Vector3dVector(
-            [[0.8, 0.8, 0.8] for _ in range(len(self.strip_set.lines))]
+            np.full((len(strips), 3), 0.8)
         )
 
         if first:
@@ -157,9 +168,6 @@ class VisualiseProcess(Process):
 
 def view_to_points_lines_colors(views):  # returns points and lines
 
-    all_points: list[np.ndarray] = []
-    all_lines: list[np.ndarray] = []
-
     camera_scale = 2.0
 
     camera_cone_points = np.array(
@@ -169,20 +177,21 @@ def view_to_points_lines_colors(views):  # returns points and lines
     camera_cone_points *= camera_scale
 
     camera_cone_lines = np.array(
-        [[0, 1], [0, 2], [0, 3], [0, 4], [1, 2], [2, 3], [3, 4], [4, 1], [3, 5], [4, 5]]
+        [[0, 1], [0, 2], [0, 3], [0, 4], [1, 2], [2, 3], [3, 4], [4, 1], [3, 5], [4, 5]],
+        dtype=np.int32,
     )
 
+    # transform each view's whole cone in one product rather than point by point
+    all_points = np.empty((len(views) * len(camera_cone_points), 3))
     for i, view in enumerate(views):
+        start = i * len(camera_cone_points)
+        all_points[start : start + len(camera_cone_points)] = (
+            camera_cone_points @ view.rotation.T + view.position
+        )
 
-        points_in_world = [
-            (view.rotation @ p + view.position) for p in camera_cone_points
-        ]
-
-        offset = i * len(camera_cone_points)
-
-        all_points.extend(points_in_world)
-        all_lines.extend(camera_cone_lines + offset)
+    offsets = np.arange(len(views), dtype=np.int32) * len(camera_cone_points)
+    all_lines = (camera_cone_lines[None, :, :] + offsets[:, None, None]).reshape(-1, 2)
 
-    all_colors = [[0.8, 0.8, 0.8] for _ in range(len(all_lines))]
+    all_colors = np.full((len(all_lines), 3), 0.8)
 
     return all_points, all_lines, all_colors
@@ -0,0 +1,122 @@
+import time
+from multiprocessing import get_context
+from queue import Empty
+
+import numpy as np
+import pytest
+
+from marimapper.detector import offer_frame
+from marimapper.queues import FrameQueue
+
+
+def make_frame(value, shape=(48, 64, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def send_frames(frame_queue, frame_count):
+    for i in range(frame_count):
+        offer_frame(frame_queue, make_frame(i % 256))
+
+
+@pytest.fixture
+def frame_queues():
+    """Make FrameQueues that are closed even if the test fails, so no slots are left behind in /dev/shm."""
+    made = []
+
+    def make(**kwargs):
+        made.append(FrameQueue(**kwargs))
+        return made[-1]
+
+    yield make
+
+    for frame_queue in made:
+        frame_queue.close()
+
+
+def test_frame_round_trip(frame_queues):
+    frame_queue = frame_queues(slots=2, max_frame_bytes=make_frame(0).nbytes)
+
+    frame = np.arange(48 * 64 * 3, dtype=np.uint8).reshape(48, 64, 3)
+    frame_queue.put_nowait(frame)
+    received = frame_queue.get(timeout=1)
+
+    assert received.dtype == frame.dtype
+    assert np.array_equal(received, frame)
+
+
+def test_grayscale_frame_round_trip(frame_queues):
+    frame_queue = frame_queues(slots=1, max_frame_bytes=make_frame(0).nbytes)
+
+    frame = np.arange(48 * 64, dtype=np.uint16).reshape(48, 64)
+    frame_queue.put_nowait(frame)
+    received = frame_queue.get(timeout=1)
+
+    assert received.shape == frame.shape
+    assert received.dtype == frame.dtype
+    assert np.array_equal(received, frame)
+
+
+def test_received_frame_is_not_overwritten(frame_queues):
+    frame_queue = frame_queues(slots=1, max_frame_bytes=make_frame(0).nbytes)
+
+    frame_queue.put_nowait(make_frame(1))
+    received = frame_queue.get(timeout=1)
+    frame_queue.put_nowait(make_frame(2))  # reuses the only slot
+
+    assert np.all(received == 1)
+
+
+def test_full_queue_drops_oldest_frame(frame_queues):
+    frame_queue = frame_queues(slots=2, max_frame_bytes=make_frame(0).nbytes)
+
+    send_frames(frame_queue, 3)
+
+    assert np.all(frame_queue.get(timeout=1) == 1)
+    assert np.all(frame_queue.get(timeout=1) == 2)
+    with pytest.raises(Empty):
+        frame_queue.get(timeout=0.1)
+
+
+def test_get_latest_frees_older_frames(frame_queues):
+    frame_queue = frame_queues(slots=3, max_frame_bytes=make_frame(0).nbytes)
+
+    send_frames(frame_queue, 3)
+
+    assert np.all(frame_queue.get_latest_nowait() == 2)
+    assert frame_queue.get_latest_nowait() is None
+
+    # every slot should be free again, so three more frames fit without dropping any
+    send_frames(frame_queue, 3)
+    assert np.all(frame_queue.get(timeout=1) == 0)
+
+
+def test_oversized_frame_rejected(frame_queues):
+    frame_queue = frame_queues(slots=1, max_frame_bytes=16)
+
+    with pytest.raises(ValueError):
+        frame_queue.put_nowait(make_frame(0))
+
+    offer_frame(frame_queue, make_frame(0))  # dropped with a warning rather than raised
+    assert frame_queue.empty()
+
+
+# enough frames for the slots to be reused many times over, not just once
+@pytest.mark.parametrize("frame_count", [10, 1000])
+def test_frames_from_another_process(frame_queues, frame_count):
+    frame_queue = frame_queues(slots=2, max_frame_bytes=make_frame(0).nbytes)
+
+    # a spawn context of its own so the test matches production without relying on global start-method state
+    sender = get_context("spawn").Process(target=send_frames, args=(frame_queue, frame_count))
+    sender.start()
+    sender.join(timeout=30)
+    assert sender.exitcode == 0
+
+    frame = None
+    deadline = time.monotonic() + 5
+    while frame is None and time.monotonic() < deadline:
+        frame = frame_queue.get_latest_nowait()
+
+    assert frame is not None
+    assert np.all(frame == frame[0, 0, 0])  # never a torn frame
+    # only the newest two frames can still be waiting
+    assert frame[0, 0, 0] in ((frame_count - 2) % 256, (frame_count - 1) % 256)